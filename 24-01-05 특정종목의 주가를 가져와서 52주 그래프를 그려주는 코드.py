@@ -1,20 +1,353 @@
-import yfinance as yf
-import matplotlib.pyplot as plt
+import argparse
 import datetime
+import os
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+import matplotlib
+import matplotlib.dates as mdates
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+# 종목별 주가 캐시 폴더 (스크립트 옆 price_cache/종목.소스.npz)
+CACHE_DIR = Path(__file__).resolve().parent / "price_cache"
+PRICE_COLUMNS = ("Open", "High", "Low", "Close", "Volume")
+
+# 일괄 조회: 동시 요청 수, 종목별 재시도 횟수와 첫 대기 시간(초, 재시도마다 2배)
+BATCH_WORKERS = 8
+BATCH_RETRIES = 3
+RETRY_DELAY = 1.0
+
+# 52주 = 252거래일. 그래프의 첫날에도 52주 최고/최저가가 온전히 계산되도록 표시 기간 + 52주를 받음
+ROLLING_WINDOW = 252
+DISPLAY_WEEKS = 52
+HISTORY_WEEKS = DISPLAY_WEEKS + 52
+
+# 보조지표: 이동평균 기간, 볼린저 밴드(기간, 표준편차 배수), RSI 기간
+SMA_WINDOWS = (20, 60)
+BOLLINGER_WINDOW = 20
+BOLLINGER_K = 2.0
+RSI_PERIOD = 14
+
+# 비교 모드: 이동 베타 계산 기간(거래일), 연율화에 쓰는 연간 거래일 수
+BETA_WINDOW = 60
+TRADING_DAYS = 252
+
+# PNG 저장: 그림 크기(인치)와 해상도. 선은 가로 픽셀 수만큼의 점으로 줄여서 그림
+CHART_FIGSIZE = (12, 6)
+CHART_DPI = 100
+
+
+def safe_filename(ticker):
+    """종목 코드를 파일 이름에 쓸 수 있게 바꿉니다 (예: ^KS11 -> _KS11)."""
+    return "".join(ch if ch.isalnum() or ch in "-_." else "_" for ch in ticker)
+
+
+class PriceSource(ABC):
+    """
+    주가 데이터 공급원. fetch(ticker, start, end)는 start 이상 end 미만 날짜의
+    Open/High/Low/Close/Volume 열을 가진 DataFrame(날짜 인덱스)을 돌려줍니다.
+    """
+    name = "base"
+
+    @abstractmethod
+    def fetch(self, ticker, start, end):
+        """start 이상 end 미만 구간의 주가 DataFrame"""
+
+
+class YahooSource(PriceSource):
+    """yfinance로 야후 파이낸스에서 받아옵니다."""
+    name = "yahoo"
+
+    def fetch(self, ticker, start, end):
+        import yfinance as yf  # 캐시만 쓰거나 CSV를 쓸 때는 필요 없음
+
+        # 기본값(raise_errors=False)은 시간 초과·요청 제한도 빈 DataFrame으로 돌려줘 재시도가 안 되므로 예외로 받음
+        return yf.Ticker(ticker).history(start=start, end=end, raise_errors=True)
+
+
+class CsvSource(PriceSource):
+    """
+    폴더 안의 '종목.csv'(Date, Open, High, Low, Close, Volume 열)를 읽습니다.
+    오프라인 작업이나 테스트용 고정 데이터에 사용합니다.
+    """
+    name = "csv"
+
+    def __init__(self, folder):
+        self.folder = Path(folder)
+
+    def fetch(self, ticker, start, end):
+        path = self.folder / f"{ticker}.csv"
+        if not path.exists():
+            return pd.DataFrame(columns=list(PRICE_COLUMNS))
+        df = pd.read_csv(path, index_col=0, parse_dates=True)
+        df.index = pd.DatetimeIndex(df.index).tz_localize(None).normalize()
+        return df[(df.index >= pd.Timestamp(start)) & (df.index < pd.Timestamp(end))]
+
+
+class PriceCache:
+    """
+    종목별 열 단위 캐시(.npz: 날짜 배열 + 가격 열 배열 + 요청했던 시작일 + 받은 날).
+    이미 있는 구간은 디스크에서 읽고, 마지막 저장일 이후의 빠진 날짜만 source에서 받아 붙입니다.
+    앞쪽은 예전에 요청한 시작일보다 더 이른 날짜를 요청할 때만 다시 받습니다
+    (상장한 지 얼마 안 된 종목처럼 자료가 요청 구간보다 짧아도 매번 전체를 받지 않음).
+    같은 날 다시 실행하면 네트워크 요청 없이 캐시만 사용합니다 (자료가 없는 종목도 마찬가지).
+    """
+
+    def __init__(self, source, cache_dir=CACHE_DIR):
+        self.source = source
+        self.cache_dir = Path(cache_dir)
+
+    def _path(self, ticker):
+        return self.cache_dir / f"{safe_filename(ticker)}.{self.source.name}.npz"
+
+    def _load(self, ticker):
+        path = self._path(ticker)
+        if not path.exists():
+            return None
+        try:
+            with np.load(path) as data:
+                return {key: data[key] for key in data.files}
+        except (OSError, ValueError):
+            return None  # 깨진 캐시는 새로 받음
+
+    def _save(self, ticker, cached):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(ticker)
+        tmp = path.with_name(path.name + ".tmp.npz")
+        np.savez(tmp, **cached)
+        os.replace(tmp, path)
+
+    @staticmethod
+    def _to_columns(df):
+        """DataFrame -> {'dates': datetime64[D], 열 이름: float64}"""
+        index = pd.DatetimeIndex(df.index)
+        if index.tz is not None:
+            index = index.tz_localize(None)
+        columns = {"dates": index.normalize().values.astype("datetime64[D]")}
+        for col in PRICE_COLUMNS:
+            if col in df:
+                columns[col] = df[col].to_numpy(dtype=np.float64)
+            else:
+                columns[col] = np.full(len(df), np.nan)
+        return columns
+
+    def get(self, ticker, start, end):
+        """start 이상 end 미만 구간 DataFrame. 필요한 부분만 source에서 받습니다."""
+        start = np.datetime64(start, "D")
+        end = np.datetime64(end, "D")
+        today = np.datetime64(datetime.date.today(), "D")
+        cached = self._load(ticker)
+        requested_from = None
+        if cached is not None:
+            if "requested_from" in cached:
+                requested_from = cached["requested_from"]
+            elif len(cached["dates"]):
+                requested_from = cached["dates"][0]     # 요청 시작일을 저장하기 전의 캐시
+
+        if (requested_from is None or start < requested_from
+                or (len(cached["dates"]) == 0 and cached["fetched_on"] < today)):
+            # 캐시가 없거나, 예전보다 이른 날짜부터 필요하거나, 자료가 없던 종목이면 (하루 한 번) 전체를 새로 받음
+            cached = self._to_columns(self.source.fetch(ticker, start.item(), end.item()))
+            cached["requested_from"] = np.array(start if requested_from is None else min(start, requested_from))
+            cached["fetched_on"] = np.array(today)
+            self._save(ticker, cached)
+        elif cached["fetched_on"] < today and len(cached["dates"]) and cached["dates"][-1] < end:
+            # 마지막 저장일부터 다시 받음 (장중에 저장된 마지막 봉은 확정값으로 덮어씀)
+            last = cached["dates"][-1]
+            fresh = self._to_columns(self.source.fetch(ticker, last.item(), end.item()))
+            if len(fresh["dates"]):
+                keep = cached["dates"] < last
+                for key in ("dates",) + PRICE_COLUMNS:
+                    cached[key] = np.concatenate([cached[key][keep], fresh[key][fresh["dates"] >= last]])
+                # 받아 온 행이 있을 때만 오늘 받은 것으로 표시 (빈 응답이면 다음 실행에서 다시 시도)
+                cached["fetched_on"] = np.array(today)
+                cached["requested_from"] = np.array(requested_from)
+                self._save(ticker, cached)
+
+        dates = cached["dates"]
+        lo, hi = np.searchsorted(dates, start), np.searchsorted(dates, end)
+        return pd.DataFrame({col: cached[col][lo:hi] for col in PRICE_COLUMNS},
+                            index=pd.DatetimeIndex(dates[lo:hi], name="Date"))
 
-def get_stock_data(ticker):
+
+def rolling_mean_std(values, window):
+    """이동평균과 이동 표준편차(모표준편차). 앞쪽 window-1개는 NaN."""
+    mean = np.full(len(values), np.nan)
+    std = np.full(len(values), np.nan)
+    if len(values) >= window:
+        windows = np.lib.stride_tricks.sliding_window_view(values, window)
+        mean[window - 1:] = windows.mean(axis=1)
+        std[window - 1:] = windows.std(axis=1)
+    return mean, std
+
+
+def rolling_peak(values, window):
+    """최근 window개 중 최고값. 앞쪽 window-1개는 그때까지의 최고값."""
+    peak = np.fmax.accumulate(values) if len(values) else values.copy()
+    if len(values) >= window:
+        peak[window - 1:] = np.nanmax(np.lib.stride_tricks.sliding_window_view(values, window), axis=1)
+    return peak
+
+
+class IndicatorEngine:
     """
-    주어진 종목 코드(ticker)에 대한 지난 52주간의 주가 데이터를 가져옵니다.
+    종가로 보조지표(이동평균, 볼린저 밴드, RSI, 52주 고점 대비 낙폭)를 계산합니다.
+    계산 결과는 날짜별로 이어지는 하나의 계산 구간으로 저장해 두고, 다음 실행에서는
+    표시 구간이 하루씩 밀려도 저장된 구간 뒤에 새로 붙은 봉만 계산한 뒤 표시 구간을 잘라 냅니다.
+    (RSI는 저장된 구간 처음부터 이어지는 값, 나머지는 최근 봉들로만 정해지는 값)
+    과거 가격이 바뀌었거나(수정주가 등) 저장된 구간과 겹치지 않으면 전체를 다시 계산합니다.
     """
+    COLUMNS = tuple(f"SMA{w}" for w in SMA_WINDOWS) + ("BB상단", "BB하단", f"RSI{RSI_PERIOD}", "낙폭")
+    VERSION = 2     # 저장 형식·지표 정의가 바뀌면 올림 (낙폭: 누적 최고 → 52주 최고 대비)
+
+    def __init__(self, cache_path=None):
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.extended = False   # 마지막 update()가 새 봉만 계산했는지
+
+    def compute(self, close):
+        """전체 구간을 벡터로 계산. 반환: (지표 열 dict, 이어 계산용 상태 dict)"""
+        close = np.asarray(close, dtype=np.float64)
+        cols = {}
+        for w in SMA_WINDOWS:
+            cols[f"SMA{w}"] = rolling_mean_std(close, w)[0]
+        mid, std = rolling_mean_std(close, BOLLINGER_WINDOW)
+        cols["BB상단"] = mid + BOLLINGER_K * std
+        cols["BB하단"] = mid - BOLLINGER_K * std
+
+        # RSI (Wilder): 첫 평균은 RSI_PERIOD개 단순평균, 이후 (이전*(n-1)+현재)/n
+        rsi = np.full(len(close), np.nan)
+        avg_gain = avg_loss = np.nan
+        delta = np.diff(close)
+        if len(delta) >= RSI_PERIOD:
+            gain, loss = np.clip(delta, 0, None), np.clip(-delta, 0, None)
+            alpha = 1.0 / RSI_PERIOD
+            seeded_gain = np.concatenate([[gain[:RSI_PERIOD].mean()], gain[RSI_PERIOD:]])
+            seeded_loss = np.concatenate([[loss[:RSI_PERIOD].mean()], loss[RSI_PERIOD:]])
+            avg_gains = pd.Series(seeded_gain).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+            avg_losses = pd.Series(seeded_loss).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+            rsi[RSI_PERIOD:] = self._rsi(avg_gains, avg_losses)
+            avg_gain, avg_loss = avg_gains[-1], avg_losses[-1]
+        cols[f"RSI{RSI_PERIOD}"] = rsi
+
+        cols["낙폭"] = close / rolling_peak(close, ROLLING_WINDOW) - 1
+        return cols, {"avg_gain": avg_gain, "avg_loss": avg_loss}
+
+    @staticmethod
+    def _rsi(avg_gain, avg_loss):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(avg_loss == 0, 100.0, 100 - 100 / (1 + avg_gain / avg_loss))
+
+    def extend(self, close, cols, state, new):
+        """close 끝의 new개 봉만 계산해 cols 뒤에 붙입니다 (앞쪽 값은 그대로)."""
+        close = np.asarray(close, dtype=np.float64)
+        n = len(close)
+        out = {}
+        for w in SMA_WINDOWS:
+            out[f"SMA{w}"] = rolling_mean_std(close[-(w - 1 + new):], w)[0][-new:]
+        mid, std = rolling_mean_std(close[-(BOLLINGER_WINDOW - 1 + new):], BOLLINGER_WINDOW)
+        out["BB상단"] = (mid + BOLLINGER_K * std)[-new:]
+        out["BB하단"] = (mid - BOLLINGER_K * std)[-new:]
+
+        avg_gain, avg_loss = float(state["avg_gain"]), float(state["avg_loss"])
+        rsi = np.empty(new)
+        for i, pos in enumerate(range(n - new, n)):
+            delta = close[pos] - close[pos - 1]
+            avg_gain = (avg_gain * (RSI_PERIOD - 1) + max(delta, 0.0)) / RSI_PERIOD
+            avg_loss = (avg_loss * (RSI_PERIOD - 1) + max(-delta, 0.0)) / RSI_PERIOD
+            rsi[i] = self._rsi(np.array(avg_gain), np.array(avg_loss))
+        out[f"RSI{RSI_PERIOD}"] = rsi
+
+        tail = close[-(ROLLING_WINDOW - 1 + new):]
+        out["낙폭"] = close[-new:] / rolling_peak(tail, ROLLING_WINDOW)[-new:] - 1
+        cols = {key: np.concatenate([cols[key], out[key]]) for key in self.COLUMNS}
+        return cols, {"avg_gain": avg_gain, "avg_loss": avg_loss}
+
+    def update(self, hist):
+        """
+        hist(날짜 인덱스, Close 열)에 맞춘 지표 DataFrame. 저장된 계산 구간이 hist 첫날을 포함하고
+        겹치는 날짜의 종가가 같으면 뒤에 새로 붙은 봉만 계산하고, 저장 구간은 hist 첫날부터로 줄여 갱신합니다.
+        """
+        dates = pd.DatetimeIndex(hist.index).values.astype("datetime64[D]")
+        close = hist["Close"].to_numpy(dtype=np.float64)
+        self.extended = False
+        run = None
+        stored = self._load()
+        if stored is not None and len(dates):
+            # 저장 구간에서 hist 첫날의 위치. 그 뒤의 저장 날짜·종가가 hist 앞부분과 같으면 이어서 계산
+            old_dates = stored["dates"]
+            lo = int(np.searchsorted(old_dates, dates[0]))
+            count = len(old_dates) - lo
+            if (0 < count <= len(dates) and np.array_equal(old_dates[lo:], dates[:count])
+                    and np.allclose(stored["close"][lo:], close[:count], equal_nan=True)
+                    and not np.isnan(stored["avg_gain"])):
+                run_close = np.concatenate([stored["close"], close[count:]])
+                cols = {key: stored[key] for key in self.COLUMNS}
+                state = {key: stored[key] for key in ("avg_gain", "avg_loss")}
+                if count < len(dates):
+                    cols, state = self.extend(run_close, cols, state, len(dates) - count)
+                    self.extended = True
+                run = {key: values[lo:] for key, values in cols.items()}, state
+        if run is None:
+            run = self.compute(close)
+        cols, state = run
+        self._save(dates, close, cols, state)
+        return pd.DataFrame(cols, index=hist.index)
+
+    def _load(self):
+        if self.cache_path is None or not self.cache_path.exists():
+            return None
+        try:
+            with np.load(self.cache_path) as data:
+                stored = {key: data[key] for key in data.files}
+        except (OSError, ValueError):
+            return None
+        if int(stored.get("version", 0)) != self.VERSION:
+            return None
+        return stored
+
+    def _save(self, dates, close, cols, state):
+        if self.cache_path is None:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.cache_path.with_name(self.cache_path.name + ".tmp.npz")
+        np.savez(tmp, version=self.VERSION, dates=dates, close=close, **cols,
+                 **{k: np.array(v) for k, v in state.items()})
+        os.replace(tmp, self.cache_path)
+
+
+def load_indicators(ticker, hist, source_name="yahoo", use_cache=True):
+    """
+    종목의 보조지표 DataFrame (price_cache/종목.소스.ind.npz에 이어 계산 상태 저장).
+    """
+    path = CACHE_DIR / f"{safe_filename(ticker)}.{source_name}.ind.npz" if use_cache else None
+    return IndicatorEngine(path).update(hist)
+
+
+def load_history(ticker, source, use_cache=True, weeks=DISPLAY_WEEKS):
+    """
+    지난 weeks주 + 52주 주가 DataFrame을 돌려줍니다. 오류는 그대로 올려 보냅니다.
+    """
+    # 오늘 날짜와 (weeks + 52)주 전 날짜 계산
+    end_date = datetime.datetime.today() + datetime.timedelta(days=1)  # 오늘까지 포함
+    start_date = end_date - datetime.timedelta(weeks=weeks + HISTORY_WEEKS - DISPLAY_WEEKS)
+
+    if use_cache:
+        return PriceCache(source).get(ticker, start_date.date(), end_date.date())
+    return source.fetch(ticker, start_date, end_date)
+
+def get_stock_data(ticker, source=None, use_cache=True, weeks=DISPLAY_WEEKS):
+    """
+    주어진 종목 코드(ticker)에 대한 지난 52주간(weeks)의 주가 데이터를 가져옵니다.
+    source를 지정하지 않으면 야후 파이낸스를 쓰고, use_cache면 price_cache/의 캐시를 먼저 봅니다.
+    """
+    source = source or YahooSource()
     try:
-        # 오늘 날짜와 52주 전 날짜 계산
-        end_date = datetime.datetime.today()
-        start_date = end_date - datetime.timedelta(weeks=52)
-        
-        # yfinance를 사용하여 데이터 다운로드
-        stock = yf.Ticker(ticker)
-        hist = stock.history(start=start_date, end=end_date)
-        
+        hist = load_history(ticker, source, use_cache, weeks)
+
         if hist.empty:
             print(f"종목 코드 '{ticker}'에 대한 데이터를 찾을 수 없습니다.")
             return None
@@ -23,37 +356,523 @@ def get_stock_data(ticker):
         print(f"데이터를 가져오는 중 오류가 발생했습니다: {e}")
         return None
 
-def plot_52_week_range(hist, ticker):
+def align_sessions(frames, column, length):
     """
-    주어진 주가 데이터(hist)를 사용하여 52주 변동폭 그래프를 그립니다.
+    종목별 열을 (종목 수, length) 배열로 모읍니다. 각 종목의 마지막 거래일이 오른쪽 끝에 오도록
+    맞추고 모자란 앞쪽은 NaN. 시장마다 휴장일이 달라도 '거래일 기준'으로 창이 계산됩니다.
+    """
+    matrix = np.full((len(frames), length), np.nan)
+    for row, df in enumerate(frames):
+        values = df[column].to_numpy(dtype=np.float64)[-length:]
+        matrix[row, length - len(values):] = values
+    return matrix
+
+def rolling_extremes(high, low, window=ROLLING_WINDOW):
+    """
+    (종목 수, 거래일 수) 배열의 이동 최고/최저가. 각 칸은 그날까지 최근 window거래일의
+    High 최대값 / Low 최소값 (앞쪽 NaN은 무시). 전체 종목을 한 번에 NumPy로 계산합니다.
+    """
+    pad = np.full((high.shape[0], window - 1), np.nan)
+    high_windows = np.lib.stride_tricks.sliding_window_view(np.hstack([pad, high]), window, axis=1)
+    low_windows = np.lib.stride_tricks.sliding_window_view(np.hstack([pad, low]), window, axis=1)
+    # fmax/fmin은 NaN을 건너뛰고, 창 전체가 NaN이면 NaN
+    return np.fmax.reduce(high_windows, axis=2), np.fmin.reduce(low_windows, axis=2)
+
+def compute_52_week_table(results, window=ROLLING_WINDOW, indicators=None):
+    """
+    {종목: DataFrame}으로 52주 분석표를 만듭니다: 현재가, 52주 최고/최저가, 최고가 대비 하락률,
+    52주 범위 안의 위치(0=최저, 1=최고). 범위 위치가 높은 순으로 정렬합니다.
+    indicators({종목: 지표 DataFrame})를 주면 마지막 날의 RSI, 이동평균 대비, 낙폭 열을 붙입니다.
     """
-    plt.figure(figsize=(12, 6))
+    tickers = list(results)
+    frames = [results[t] for t in tickers]
+    high = align_sessions(frames, "High", window)
+    low = align_sessions(frames, "Low", window)
+    close = align_sessions(frames, "Close", 1)[:, 0]
+
+    # 마지막 날의 52주 최고/최저 = 최근 window거래일 전체의 최대/최소 (NaN 무시)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        high_52w = np.fmax.reduce(high, axis=1)
+        low_52w = np.fmin.reduce(low, axis=1)
+        from_high = close / high_52w - 1
+        span = high_52w - low_52w
+        position = np.where(span > 0, (close - low_52w) / span, np.nan)
+
+    table = pd.DataFrame({
+        "종목": tickers,
+        "기준일": [df.index[-1].date() for df in frames],
+        "현재가": close,
+        "52주 최고가": high_52w,
+        "52주 최저가": low_52w,
+        "최고가 대비(%)": from_high * 100,
+        "52주 범위 위치(%)": position * 100,
+        "거래일 수": [min(len(df), window) for df in frames],
+    })
+    if indicators:
+        last = pd.DataFrame([indicators[t].iloc[-1] for t in tickers]).reset_index(drop=True)
+        table[f"RSI({RSI_PERIOD})"] = last[f"RSI{RSI_PERIOD}"].to_numpy()
+        for w in SMA_WINDOWS:
+            table[f"SMA{w} 대비(%)"] = (close / last[f"SMA{w}"].to_numpy() - 1) * 100
+        table["52주 고점 대비 낙폭(%)"] = last["낙폭"].to_numpy() * 100
+    table = table.sort_values("52주 범위 위치(%)", ascending=False, na_position="last", kind="stable")
+    table.insert(0, "순위", np.arange(1, len(table) + 1))
+    return table.reset_index(drop=True)
+
+def save_table(table, path):
+    """
+    분석표 저장: 확장자가 .xlsx면 엑셀, 그 외는 CSV(엑셀에서 한글이 깨지지 않도록 BOM 포함).
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".xlsx":
+        table.round(2).to_excel(path, index=False)
+    else:
+        table.round(2).to_csv(path, index=False, encoding="utf-8-sig")
+
+def lttb(x, y, n_out):
+    """
+    Largest-Triangle-Three-Buckets 다운샘플링. 모양(고점·저점)을 살리면서 n_out개 점의 인덱스를 고릅니다.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)  # 첫·끝 점을 뺀 n_out-2개 구간
+    picked = np.empty(n_out, dtype=np.int64)
+    picked[0], picked[-1] = 0, n - 1
+    prev = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # 다음 구간의 평균 점 (마지막 구간은 끝 점)
+        nlo, nhi = hi, edges[i + 2] if i + 2 < len(edges) else n
+        nx, ny = x[nlo:nhi].mean(), y[nlo:nhi].mean()
+        area = np.abs((x[prev] - nx) * (y[lo:hi] - y[prev]) - (x[prev] - x[lo:hi]) * (ny - y[prev]))
+        prev = lo + int(np.argmax(area))
+        picked[i + 1] = prev
+    return picked
+
+def chart_series(hist, indicators=None, weeks=DISPLAY_WEEKS):
+    """
+    그래프에 그릴 표시 구간(최근 weeks주)의 x(matplotlib 날짜 숫자)와 {이름: 값 배열}.
+    indicators(지표 DataFrame)를 주지 않으면 캐시 없이 바로 계산합니다.
+    """
+    if indicators is None:
+        indicators = IndicatorEngine().update(hist)
+    high = hist['High'].to_numpy(dtype=np.float64)[None, :]
+    low = hist['Low'].to_numpy(dtype=np.float64)[None, :]
+    high_52w, low_52w = rolling_extremes(high, low)
+    shown = np.flatnonzero(hist.index >= hist.index[-1] - pd.Timedelta(weeks=weeks))
+    series = {col: indicators[col].to_numpy()[shown] for col in indicators.columns}
+    series['Close'] = hist['Close'].to_numpy(dtype=np.float64)[shown]
+    series['High52'] = high_52w[0][shown]
+    series['Low52'] = low_52w[0][shown]
+    x = mdates.date2num(pd.DatetimeIndex(hist.index[shown]).tz_localize(None).to_pydatetime())
+    return x, series
+
+def draw_52_week_range(ax, hist, ticker, max_points=None, indicators=None, weeks=DISPLAY_WEEKS):
+    """
+    ax에 52주 변동폭 그래프를 그립니다. max_points를 주면 선을 그 점 수로 줄여서 그립니다 (LTTB).
+    반환: (x, 전체 값 dict, 선 dict) - 확대/축소 때 다시 줄여 그릴 때 사용
+    """
+    x, series = chart_series(hist, indicators, weeks)
+    keep = lttb(x, np.nan_to_num(series['Close']), max_points) if max_points else slice(None)
+    
+    # 볼린저 밴드와 이동평균
+    artists = {}
+    artists['band'] = ax.fill_between(x[keep], series["BB하단"][keep], series["BB상단"][keep], color='gray',
+                                      alpha=0.15, label=f'볼린저 밴드({BOLLINGER_WINDOW}, {BOLLINGER_K:g}σ)')
+    for w, color in zip(SMA_WINDOWS, ('orange', 'purple')):
+        artists[f"SMA{w}"], = ax.plot(x[keep], series[f"SMA{w}"][keep], label=f'{w}일 이동평균',
+                                      color=color, linewidth=1)
     
     # 종가(Close) 그래프 그리기
-    plt.plot(hist.index, hist['Close'], label='종가', color='blue')
-    
-    # 최고가(High)와 최저가(Low) 그래프 그리기
-    plt.plot(hist.index, hist['High'], label='52주 최고가', color='green', linestyle='--')
-    plt.plot(hist.index, hist['Low'], label='52주 최저가', color='red', linestyle='--')
-    
-    plt.title(f"{ticker}의 지난 52주 주가 변동폭")
-    plt.xlabel("날짜")
-    plt.ylabel("가격 (USD)")  # 한국 주식을 원한다면 통화 단위를 KRW로 변경하세요.
-    plt.legend()
-    plt.grid(True)
-    plt.tight_layout()
+    artists['Close'], = ax.plot(x[keep], series['Close'][keep], label='종가', color='blue')
+    
+    # 그날까지 최근 252거래일의 최고가·최저가 그래프 그리기
+    artists['High52'], = ax.plot(x[keep], series['High52'][keep], label='52주 최고가', color='green', linestyle='--')
+    artists['Low52'], = ax.plot(x[keep], series['Low52'][keep], label='52주 최저가', color='red', linestyle='--')
+    ax.xaxis_date()
+    
+    rsi, drawdown = series[f"RSI{RSI_PERIOD}"][-1], series["낙폭"][-1]
+    ax.set_title(f"{ticker}의 지난 {weeks}주 주가 변동폭  (RSI {rsi:.0f} · 52주 고점 대비 {drawdown * 100:.1f}%)")
+    ax.set_xlabel("날짜")
+    ax.set_ylabel("가격 (USD)")  # 한국 주식을 원한다면 통화 단위를 KRW로 변경하세요.
+    ax.legend()
+    ax.grid(True)
+    return x, series, artists
+
+class ZoomDecimator:
+    """
+    대화형 그래프에서 x축 범위가 바뀔 때(확대·이동·창 크기 변경) 보이는 구간만
+    화면 가로 픽셀 수로 다시 줄여 그립니다. 확대하면 원래 데이터가 그대로 보입니다.
+    """
+
+    def __init__(self, ax, x, series, artists):
+        self.ax = ax
+        self.x = x
+        self.series = series
+        self.artists = artists
+        self._last = None
+
+    def connect(self):
+        self.ax.callbacks.connect('xlim_changed', self.refresh)
+        self.ax.figure.canvas.mpl_connect('resize_event', self.refresh)
+        self.refresh()
+
+    def refresh(self, _event=None):
+        lo, hi = self.ax.get_xlim()
+        # 화면 밖 양쪽 한 점씩 포함해야 선이 가장자리까지 이어짐
+        start = max(0, int(np.searchsorted(self.x, lo)) - 1)
+        stop = min(len(self.x), int(np.searchsorted(self.x, hi, side='right')) + 1)
+        width = max(3, int(self.ax.bbox.width))
+        if (start, stop, width) == self._last or stop - start < 2:
+            return
+        self._last = (start, stop, width)
+        x = self.x[start:stop]
+        keep = lttb(x, np.nan_to_num(self.series['Close'][start:stop]), width)
+        for name, artist in self.artists.items():
+            if name != 'band':
+                artist.set_data(x[keep], self.series[name][start:stop][keep])
+        band = self.artists['band']
+        self.artists['band'] = self.ax.fill_between(
+            x[keep], self.series["BB하단"][start:stop][keep], self.series["BB상단"][start:stop][keep],
+            color=band.get_facecolor(), label=band.get_label())
+        band.remove()
+        self.ax.figure.canvas.draw_idle()
+
+def plot_52_week_range(hist, ticker, indicators=None, weeks=DISPLAY_WEEKS):
+    """
+    주어진 주가 데이터(hist)를 사용하여 52주 변동폭 그래프를 그립니다.
+    몇 년치를 그려도 보이는 구간만 화면 해상도로 줄여 그리므로 확대·이동이 느려지지 않습니다.
+    """
+    fig, ax = plt.subplots(figsize=CHART_FIGSIZE)
+    x, series, artists = draw_52_week_range(ax, hist, ticker, indicators=indicators, weeks=weeks,
+                                            max_points=int(CHART_FIGSIZE[0] * fig.dpi))
+    fig.tight_layout()
+    decimator = ZoomDecimator(ax, x, series, artists)
+    decimator.connect()
     plt.show()
 
+# PNG 렌더링 프로세스마다 한 번 만들어 계속 쓰는 그림 (종목마다 새로 만들지 않음)
+_render_figure = None
+
+def init_render_worker():
+    """
+    렌더링 프로세스 초기화: 화면 없이 그리는 Agg 백엔드로 전환합니다.
+    """
+    matplotlib.use("Agg")
+
+def render_chart_png(ticker, hist, out_dir, indicators=None, weeks=DISPLAY_WEEKS):
+    """
+    종목 하나를 out_dir/종목.png로 저장합니다. 반환: (종목, 저장 경로 또는 None, 오류)
+    """
+    global _render_figure
+    try:
+        if _render_figure is None:
+            # tight_layout은 그릴 때마다 한 번 더 렌더링하므로 여백을 고정
+            _render_figure = plt.figure(figsize=CHART_FIGSIZE, dpi=CHART_DPI)
+            _render_figure.add_subplot()
+            _render_figure.subplots_adjust(left=0.07, right=0.98, top=0.93, bottom=0.09)
+        fig = _render_figure
+        ax = fig.axes[0]
+        ax.clear()
+        draw_52_week_range(ax, hist, ticker, max_points=int(CHART_FIGSIZE[0] * CHART_DPI),
+                           indicators=indicators, weeks=weeks)
+        path = Path(out_dir) / f"{safe_filename(ticker)}.png"
+        fig.savefig(path, dpi=CHART_DPI)
+        return ticker, str(path), None
+    except Exception as e:
+        return ticker, None, f"{type(e).__name__}: {e}"
+
+def render_charts(results, out_dir, workers=None, indicators=None, weeks=DISPLAY_WEEKS):
+    """
+    여러 종목 그래프를 프로세스 풀에서 동시에 PNG로 저장합니다 (데스크톱 없이 야간 일괄 생성용).
+    """
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+    started = time.perf_counter()
+    saved, failures = 0, []
+    workers = max(1, min(workers or os.cpu_count() or 1, len(results)))
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_render_worker) as pool:
+        futures = [pool.submit(render_chart_png, t, hist, out_dir, (indicators or {}).get(t), weeks)
+                   for t, hist in results.items()]
+        for future in as_completed(futures):
+            ticker, path, error = future.result()
+            if error:
+                failures.append((ticker, error))
+            else:
+                saved += 1
+            print(f"\r  그래프 저장 중... {saved + len(failures)}/{len(results)}", end="", flush=True)
+    print()
+    print(f"그래프 {saved}개를 저장했습니다: {out_dir} ({time.perf_counter() - started:.1f}초)")
+    for ticker, error in failures:
+        print(f"  그래프 실패 {ticker}: {error}")
+
+def read_ticker_list(path):
+    """
+    종목 목록 파일 읽기: 한 줄에 하나 또는 쉼표로 구분, '#' 뒤는 주석.
+    """
+    tickers = []
+    with open(path, encoding="utf-8-sig") as f:
+        for line in f:
+            for item in line.split("#", 1)[0].split(","):
+                if item.strip():
+                    tickers.append(item.strip().upper())
+    return list(dict.fromkeys(tickers))
+
+def fetch_one_with_retry(ticker, source, use_cache, retries, delay, weeks=DISPLAY_WEEKS):
+    """
+    종목 하나를 받아옵니다. 오류가 나거나 빈 데이터가 오면 간격을 2배씩 늘려 retries번까지 다시 시도합니다.
+    반환: (ticker, DataFrame 또는 None, 실패 사유 또는 None)
+    """
+    for attempt in range(retries + 1):
+        try:
+            hist = load_history(ticker, source, use_cache, weeks)
+            if not hist.empty:
+                return ticker, hist, None
+            reason = "데이터 없음"
+        except Exception as e:
+            reason = f"{type(e).__name__}: {e}"
+        if attempt == retries:
+            return ticker, None, reason
+        time.sleep(delay * (2 ** attempt))
+
+def fetch_many(tickers, source, use_cache=True, workers=BATCH_WORKERS, retries=BATCH_RETRIES, delay=RETRY_DELAY,
+               weeks=DISPLAY_WEEKS):
+    """
+    여러 종목을 동시에 받아옵니다 (최대 workers개씩). 실패한 종목이 있어도 나머지는 계속 진행합니다.
+    반환: ({종목: DataFrame}, [(종목, 실패 사유)])
+    """
+    results, failures = {}, []
+    done = 0
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(tickers)))) as pool:
+        futures = [pool.submit(fetch_one_with_retry, t, source, use_cache, retries, delay, weeks) for t in tickers]
+        for future in as_completed(futures):
+            ticker, hist, error = future.result()
+            done += 1
+            if error:
+                failures.append((ticker, error))
+            else:
+                results[ticker] = hist
+            print(f"\r  받는 중... {done}/{len(tickers)} (실패 {len(failures)})", end="", flush=True)
+    print()
+    order = {t: i for i, t in enumerate(tickers)}
+    failures.sort(key=lambda item: order[item[0]])
+    return results, failures
+
+def fetch_batch(tickers, source, args):
+    """
+    일괄·비교 모드 공통: 종목 목록을 동시에 받고 성공/실패를 출력합니다.
+    """
+    print(f"{len(tickers)}개 종목을 최대 {args.workers}개씩 동시에 받아옵니다.")
+    started = time.perf_counter()
+    results, failures = fetch_many(tickers, source, use_cache=not args.no_cache,
+                                   workers=args.workers, retries=args.retries, weeks=args.weeks)
+    print(f"완료: 성공 {len(results)} / 실패 {len(failures)} ({time.perf_counter() - started:.1f}초)")
+    for ticker, error in failures:
+        print(f"  실패 {ticker}: {error}")
+    return results, failures
+
+def align_closes(results, weeks=DISPLAY_WEEKS):
+    """
+    종목별 종가를 하나의 날짜 인덱스(모든 종목 거래일의 합집합)에 맞춘 DataFrame (날짜 x 종목).
+    휴장일은 직전 종가로 채우고, 모든 종목에 값이 있는 날부터 최근 weeks주만 남깁니다.
+    """
+    columns = {}
+    for ticker, df in results.items():
+        index = pd.DatetimeIndex(df.index)
+        if index.tz is not None:
+            index = index.tz_localize(None)
+        columns[ticker] = pd.Series(df['Close'].to_numpy(dtype=np.float64), index=index.normalize())
+    closes = pd.DataFrame(columns).sort_index().ffill()
+    closes = closes[closes.index >= closes.index[-1] - pd.Timedelta(weeks=weeks)]
+    return closes.dropna()
+
+def rolling_sum(values, window):
+    """(날짜, 종목) 배열의 이동 합 (누적합의 차이, 모든 종목을 한 번에)."""
+    cumsum = np.cumsum(np.vstack([np.zeros((1, values.shape[1])), values]), axis=0)
+    return cumsum[window:] - cumsum[:-window]
+
+def compare_analytics(closes, benchmark, window=BETA_WINDOW):
+    """
+    정렬된 종가(날짜 x 종목)로 비교 지표를 한 번에 계산합니다.
+    반환: (기준일=100 정규화 배열, 일간 로그수익률 상관행렬, 이동 베타 배열, 요약 DataFrame)
+    베타는 benchmark 종목 대비, 이동 베타는 최근 window거래일 기준입니다.
+    """
+    tickers = list(closes.columns)
+    values = closes.to_numpy(dtype=np.float64)
+    normalized = values / values[0] * 100
+    returns = np.diff(np.log(values), axis=0)
+    corr = np.corrcoef(returns, rowvar=False).reshape(len(tickers), len(tickers))
+
+    market = returns[:, [tickers.index(benchmark)]]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # 전체 기간 베타 = cov(r_i, r_m) / var(r_m)
+        centered = returns - returns.mean(axis=0)
+        centered_m = market - market.mean()
+        beta = (centered * centered_m).sum(axis=0) / (centered_m ** 2).sum()
+        # 이동 베타: 합계로 공분산·분산을 구해 모든 날짜·종목을 한 번에 계산
+        rolling_betas = np.full((0, len(tickers)), np.nan)
+        if len(returns) >= window:
+            sum_xy = rolling_sum(returns * market, window)
+            sum_x = rolling_sum(returns, window)
+            sum_y = rolling_sum(market, window)
+            sum_yy = rolling_sum(market * market, window)
+            cov = sum_xy / window - sum_x * sum_y / window ** 2
+            var = sum_yy / window - (sum_y / window) ** 2
+            rolling_betas = cov / var
+
+    summary = pd.DataFrame({
+        "종목": tickers,
+        "수익률(%)": normalized[-1] - 100,
+        "연 변동성(%)": returns.std(axis=0) * np.sqrt(TRADING_DAYS) * 100,
+        f"{benchmark} 상관": corr[tickers.index(benchmark)],
+        "베타(전체)": beta,
+        f"베타(최근 {window}일)": rolling_betas[-1] if len(rolling_betas) else np.nan,
+    }).sort_values("수익률(%)", ascending=False, kind="stable").reset_index(drop=True)
+    return normalized, corr, rolling_betas, summary
+
+def draw_compare(fig, closes, normalized, corr, benchmark):
+    """
+    비교 그래프: 왼쪽은 기준일=100 정규화 주가 겹쳐 그리기, 오른쪽은 수익률 상관 히트맵.
+    """
+    tickers = list(closes.columns)
+    ax_line, ax_heat = fig.subplots(1, 2, gridspec_kw={"width_ratios": [3, 2]})
+    x = mdates.date2num(closes.index.to_pydatetime())
+    keep = lttb(x, normalized.mean(axis=1), int(fig.get_figwidth() * fig.dpi * 0.6))
+    # 선을 한 번에 그림 (종목마다 plot 호출하지 않음)
+    lines = ax_line.plot(x[keep], normalized[keep], linewidth=1, alpha=0.8)
+    for line, ticker in zip(lines, tickers):
+        line.set_label(ticker)
+        if ticker == benchmark:
+            line.set_linewidth(2.5)
+            line.set_color('black')
+            line.set_zorder(3)
+    ax_line.xaxis_date()
+    ax_line.axhline(100, color='gray', linewidth=0.8)
+    ax_line.set_title(f"{closes.index[0]:%Y-%m-%d} = 100 기준 주가 비교 ({len(tickers)}종목)")
+    ax_line.grid(True)
+    if len(tickers) <= 15:
+        ax_line.legend(fontsize=8)
+
+    image = ax_heat.imshow(corr, cmap='RdBu_r', vmin=-1, vmax=1, interpolation='nearest')
+    ax_heat.set_title("일간 수익률 상관계수")
+    if len(tickers) <= 40:
+        ax_heat.set_xticks(range(len(tickers)), tickers, rotation=90, fontsize=7)
+        ax_heat.set_yticks(range(len(tickers)), tickers, fontsize=7)
+    else:
+        ax_heat.set_xticks([])
+        ax_heat.set_yticks([])
+    fig.colorbar(image, ax=ax_heat, fraction=0.046, pad=0.04)
+    fig.tight_layout()
+
+def run_compare(tickers, source, args):
+    """
+    비교 모드: 여러 종목을 같은 날짜에 맞춰 정규화 비교, 상관행렬, 벤치마크 대비 베타를 계산하고 그래프를 그립니다.
+    """
+    results, failures = fetch_batch(tickers, source, args)
+    if len(results) < 2:
+        print("비교하려면 데이터가 있는 종목이 2개 이상 필요합니다.")
+        return
+    benchmark = (args.benchmark or next(t for t in tickers if t in results)).upper()
+    if benchmark not in results:
+        print(f"벤치마크 '{benchmark}'의 데이터가 없습니다.")
+        return
+
+    started = time.perf_counter()
+    closes = align_closes(results, args.weeks)
+    if len(closes) <= 2:
+        print("모든 종목에 공통으로 있는 거래일이 부족합니다.")
+        return
+    normalized, corr, rolling_betas, summary = compare_analytics(closes, benchmark)
+    print(f"\n{len(closes.columns)}종목 · {len(closes)}거래일 비교 (벤치마크 {benchmark}, "
+          f"계산 {(time.perf_counter() - started) * 1000:.0f}ms)")
+    print(summary.head(args.top).round(3).to_string(index=False))
+    if args.out:
+        save_table(summary, args.out)
+        print(f"\n비교표를 저장했습니다: {args.out}")
+
+    if args.png_dir:
+        init_render_worker()
+    fig = plt.figure(figsize=(16, 7))
+    draw_compare(fig, closes, normalized, corr, benchmark)
+    if args.png_dir:
+        Path(args.png_dir).mkdir(parents=True, exist_ok=True)
+        path = Path(args.png_dir) / "compare.png"
+        fig.savefig(path, dpi=CHART_DPI)
+        print(f"비교 그래프를 저장했습니다: {path}")
+    else:
+        plt.show()
+
+def run_batch(tickers, source, args):
+    """
+    일괄 모드: 모든 종목을 받아 캐시에 저장하고 결과를 요약합니다.
+    """
+    results, failures = fetch_batch(tickers, source, args)
+    if not results:
+        return results, failures
+
+    # 보조지표 (캐시에 저장된 계산 뒤로 새 봉만 계산)
+    indicators = {t: load_indicators(t, hist, source.name, use_cache=not args.no_cache)
+                  for t, hist in results.items()}
+
+    # 52주 분석표 (범위 위치 순)
+    table = compute_52_week_table(results, indicators=indicators)
+    print()
+    print(table.head(args.top).round(2).to_string(index=False))
+    if args.out:
+        save_table(table, args.out)
+        print(f"\n분석표를 저장했습니다: {args.out}")
+    if args.png_dir:
+        render_charts(results, args.png_dir, args.render_workers, indicators, args.weeks)
+    return results, failures
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="종목의 지난 52주 주가 그래프")
+    parser.add_argument("ticker", nargs="?", help="종목 코드 (없으면 입력 받음)")
+    parser.add_argument("--csv-dir", help="야후 대신 이 폴더의 '종목.csv'에서 주가를 읽음 (오프라인용)")
+    parser.add_argument("--no-cache", action="store_true", help="price_cache/ 캐시를 쓰지 않고 매번 새로 받음")
+    parser.add_argument("--weeks", type=int, default=DISPLAY_WEEKS, help="그래프에 보여 줄 기간(주). 예: 520 = 10년")
+    parser.add_argument("--tickers", help="일괄 모드: 쉼표로 구분한 종목 코드 목록")
+    parser.add_argument("--batch", metavar="FILE", help="일괄 모드: 종목 코드 목록 파일 (한 줄에 하나 또는 쉼표 구분)")
+    parser.add_argument("--workers", type=int, default=BATCH_WORKERS, help="일괄 모드 동시 요청 수")
+    parser.add_argument("--retries", type=int, default=BATCH_RETRIES, help="일괄 모드 종목별 재시도 횟수")
+    parser.add_argument("--out", help="일괄 모드: 52주 분석표 저장 파일 (.csv 또는 .xlsx)")
+    parser.add_argument("--top", type=int, default=20, help="일괄 모드: 화면에 보여 줄 상위 종목 수")
+    parser.add_argument("--png-dir", help="창을 띄우지 않고 그래프를 이 폴더에 PNG로 저장")
+    parser.add_argument("--render-workers", type=int, help="PNG 저장 프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--compare", action="store_true", help="비교 모드: --tickers/--batch 종목을 정규화·상관·베타로 비교")
+    parser.add_argument("--benchmark", help="비교 모드 베타 기준 종목 (기본: 목록의 첫 종목)")
+    return parser.parse_args()
+
 def main():
+    args = parse_args()
+    source = CsvSource(args.csv_dir) if args.csv_dir else YahooSource()
+    
+    # 일괄 모드: 종목 목록을 동시에 받아 요약
+    if args.tickers or args.batch:
+        tickers = read_ticker_list(args.batch) if args.batch else []
+        tickers += [t.strip().upper() for t in (args.tickers or "").split(",") if t.strip()]
+        if args.compare:
+            run_compare(list(dict.fromkeys(tickers)), source, args)
+        else:
+            run_batch(list(dict.fromkeys(tickers)), source, args)
+        return
+    
     # 사용자로부터 종목 코드 입력 받기
-    ticker = input("주가를 조회할 종목 코드를 입력하세요 (예: AAPL, 005930.KS): ").strip().upper()
+    ticker = (args.ticker or input("주가를 조회할 종목 코드를 입력하세요 (예: AAPL, 005930.KS): ")).strip().upper()
     
     # 주가 데이터 가져오기
-    hist = get_stock_data(ticker)
+    hist = get_stock_data(ticker, source, use_cache=not args.no_cache, weeks=args.weeks)
     
     if hist is not None:
+        indicators = load_indicators(ticker, hist, source.name, use_cache=not args.no_cache)
+        if args.png_dir:
+            # 창 없이 PNG로 저장
+            init_render_worker()
+            Path(args.png_dir).mkdir(parents=True, exist_ok=True)
+            _, path, error = render_chart_png(ticker, hist, args.png_dir, indicators, args.weeks)
+            print(f"그래프를 저장했습니다: {path}" if path else f"그래프 저장 실패: {error}")
+            return
         # 그래프 그리기
-        plot_52_week_range(hist, ticker)
+        plot_52_week_range(hist, ticker, indicators, args.weeks)
 
 if __name__ == "__main__":
     main()
@@ -1,36 +1,310 @@
+import argparse
+import fnmatch
 import os
+import pickle
 import platform
+import re
 import subprocess
-from openpyxl import Workbook, load_workbook
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from openpyxl import Workbook
 
-def collect_subfolders(folder_path):
+# 엑셀 시트 한 장의 최대 행 수 (넘으면 다음 시트로 이어서 기록)
+EXCEL_MAX_ROWS = 1_048_576
+SHEET_TITLE = "Subfolders"
+
+# 폴더 목록 읽기를 동시에 돌리는 스레드 수와, 앞으로 방문할 폴더를 미리 읽어 두는 최대 개수
+# (NAS·네트워크 드라이브는 폴더 하나 읽을 때마다 지연이 있어 동시에 여러 개를 읽는 편이 빠름)
+WALK_WORKERS = 16
+WALK_LOOKAHEAD = 256
+
+# 스냅샷 파일 형식 버전 (엑셀 파일 옆 '엑셀이름.snapshot.pkl')
+SNAPSHOT_VERSION = 2
+
+def compile_excludes(patterns):
     """
-    folder_path 및 모든 하위 폴더를 순회하여,
-    디렉터리 경로만 리스트로 수집(파일 제외).
+    제외할 폴더 이름 패턴 목록(예: ['.git', 'node_modules', '*_backup'])을 정규식 하나로 컴파일.
+    Windows에서는 대소문자 구분 없음.
     """
-    subfolders = []
-    for root, dirs, files in os.walk(folder_path):
-        for d in dirs:
-            full_path = os.path.join(root, d)
-            subfolders.append(full_path)
-    return subfolders
+    patterns = [p.strip() for p in patterns or [] if p.strip()]
+    if not patterns:
+        return None
+    flags = re.IGNORECASE if os.name == "nt" else 0
+    return re.compile("|".join(fnmatch.translate(p) for p in patterns), flags)
 
-def remove_prefix_in_excel(file_path, sheet_name, target_col, prefix_to_remove):
+def list_subdirs(path):
     """
-    이미 존재하는 엑셀 파일(file_path)을 열어,
-    sheet_name 시트의 target_col 열에서 prefix_to_remove로 시작하는 접두어를 제거.
-    예) 'M:\\애니노블\\폴더이름' → '폴더이름'
+    path 바로 아래 폴더들의 (이름, 전체 경로, 심볼릭 링크 여부)를 이름순으로.
+    DirEntry의 종류 정보를 써서 항목마다 stat을 따로 하지 않음. 읽을 수 없는 폴더는 빈 목록.
+    """
+    try:
+        with os.scandir(path) as it:
+            subdirs = [(e.name, e.path, e.is_symlink()) for e in it if e.is_dir()]
+    except OSError:
+        return []
+    subdirs.sort()
+    return subdirs
+
+class FolderStats:
+    """
+    폴더를 읽으면서 파일 통계(파일 수, 용량 합계, 가장 최근 수정 시각)도 같이 모음.
+    파일 크기·수정 시각은 scandir 항목의 stat 정보를 씀 (Windows는 폴더 목록에 들어 있어 추가 호출 없음,
+    그 외에는 파일마다 lstat 한 번). 심볼릭 링크 파일은 링크 자체의 크기로 셈.
+    """
+
+    def __init__(self):
+        self.own = {}   # 폴더 경로 -> (파일 수, 바이트, 최근 수정 시각 또는 None)
+
+    def list_subdirs(self, path):
+        """list_subdirs()와 같은 결과를 돌려주고, 폴더 바로 안 파일 통계는 self.own에 기록"""
+        subdirs = []
+        files = size = 0
+        newest = None
+        try:
+            with os.scandir(path) as it:
+                for e in it:
+                    try:
+                        if e.is_dir():
+                            subdirs.append((e.name, e.path, e.is_symlink()))
+                            continue
+                        st = e.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    files += 1
+                    size += st.st_size
+                    if newest is None or st.st_mtime > newest:
+                        newest = st.st_mtime
+        except OSError:
+            pass
+        subdirs.sort()
+        # 여러 스레드에서 호출되지만 서로 다른 키에 한 번씩만 대입
+        self.own[path] = (files, size, newest)
+        return subdirs
+
+class FolderSnapshot:
+    """
+    폴더 트리 스냅샷: 폴더 경로 → (mtime_ns, inode, [(하위 폴더 이름, 링크 여부, inode)]).
+    폴더 안의 항목이 추가·삭제·이름 변경되면 그 폴더의 수정 시각이 바뀌므로,
+    수정 시각이 이전 스냅샷과 같은 폴더는 다시 읽지 않고 이전 하위 폴더 목록을 그대로 씀.
+    """
+
+    def __init__(self, previous=None):
+        self.previous = previous or {}
+        self.entries = {}
+        self.relisted = 0
+
+    def list_subdirs(self, path):
+        """list_subdirs()와 같은 결과. 바뀌지 않은 폴더는 stat 한 번으로 끝냄"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return []
+        old = self.previous.get(path)
+        if old is not None and old[0] == st.st_mtime_ns:
+            children = old[2]
+        else:
+            children = self._scan(path)
+            self.relisted += 1
+        # 여러 스레드에서 호출되지만 서로 다른 키에 한 번씩만 대입
+        self.entries[path] = (st.st_mtime_ns, st.st_ino, children)
+        return [(name, os.path.join(path, name), is_link) for name, is_link, _ in children]
+
+    @staticmethod
+    def _scan(path):
+        """하위 폴더 (이름, 링크 여부, inode) 목록. inode는 max_depth 경계처럼 목록을 읽지 않는 폴더의 이름 변경 확인용"""
+        children = []
+        try:
+            with os.scandir(path) as it:
+                for e in it:
+                    try:
+                        if e.is_dir():
+                            children.append((e.name, e.is_symlink(), e.inode()))
+                    except OSError:
+                        continue
+        except OSError:
+            return []
+        children.sort()
+        return children
+
+def snapshot_path_for(excel_path):
+    return os.path.splitext(excel_path)[0] + ".snapshot.pkl"
+
+def load_snapshot(path, folder_path, options):
+    """
+    이전 스냅샷의 폴더 항목. 없거나, 조사 폴더·옵션(깊이, 제외 패턴)이 다르면 빈 dict.
+    """
+    try:
+        with open(path, "rb") as f:
+            data = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+        return {}
+    if (data.get("version") != SNAPSHOT_VERSION or data.get("root") != folder_path
+            or data.get("options") != options):
+        return {}
+    return data["entries"]
+
+def save_snapshot(path, folder_path, options, entries):
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        pickle.dump({"version": SNAPSHOT_VERSION, "root": folder_path, "options": options,
+                     "entries": entries}, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, path)
+
+def snapshot_folders(entries, exclude=None):
+    """
+    스냅샷에 들어 있는 폴더 경로 → inode. 목록을 읽은 폴더의 하위 폴더 기록에서 모으므로,
+    목록에는 나오지만 안으로 들어가지 않는 폴더(max_depth 경계, 심볼릭 링크)도 포함.
+    """
+    folders = {}
+    for path, (_, _, children) in entries.items():
+        for name, _, inode in children:
+            if exclude is None or not exclude.fullmatch(name):
+                folders[os.path.join(path, name)] = inode
+    return folders
+
+def diff_snapshots(old, new, exclude=None):
+    """
+    두 스냅샷의 폴더 차이: [(구분, 경로, 이전 경로)]. 구분은 '추가', '삭제', '이름 변경'.
+    삭제된 경로와 추가된 경로의 inode가 같으면 이름 변경(이동)으로 보고,
+    상위 폴더의 이름 변경 때문에 함께 바뀐 하위 폴더는 따로 적지 않음.
+    """
+    old_folders = snapshot_folders(old, exclude)
+    new_folders = snapshot_folders(new, exclude)
+    added = new_folders.keys() - old_folders.keys()
+    removed = old_folders.keys() - new_folders.keys()
+    removed_by_inode = {old_folders[p]: p for p in removed if old_folders[p]}
+
+    renamed = {}
+    for path in added:
+        old_path = removed_by_inode.get(new_folders[path])
+        if old_path is not None:
+            renamed[path] = old_path
+    changes = []
+    for path, old_path in renamed.items():
+        parent, old_parent = os.path.dirname(path), os.path.dirname(old_path)
+        if renamed.get(parent) != old_parent:
+            changes.append(("이름 변경", path, old_path))
+    renamed_old = set(renamed.values())
+    changes += [("추가", p, "") for p in added if p not in renamed]
+    changes += [("삭제", p, "") for p in removed if p not in renamed_old]
+    order = {"추가": 0, "삭제": 1, "이름 변경": 2}
+    changes.sort(key=lambda c: (order[c[0]], c[1]))
+    return changes
+
+def walk_folders(folder_path, max_depth=None, exclude=None,
+                 workers=WALK_WORKERS, lookahead=WALK_LOOKAHEAD, lister=list_subdirs):
+    """
+    folder_path부터 목록을 읽은 폴더마다 (경로, 깊이, [(하위 폴더 경로, 안으로 들어가는지)])를
+    이름순 깊이 우선 순서로 하나씩 돌려줌. 폴더 목록 읽기(lister)는 스레드 풀에서 미리 동시에 함.
+    - max_depth: 1이면 바로 아래 폴더만
+    - exclude: compile_excludes()로 만든 패턴. 일치하는 폴더는 건너뛰고 그 안으로도 들어가지 않음
+    """
+    pool = ThreadPoolExecutor(max_workers=max(1, workers))
+    pending = {}                    # 경로 -> 목록 읽기 Future (방문 예정)
+    stack = [(folder_path, 0)]      # 깊이 우선 방문 예정 (끝이 다음 차례)
+    try:
+        while stack:
+            # 곧 방문할 폴더들의 목록을 미리 요청 (최대 lookahead개)
+            for path, _ in reversed(stack[-lookahead:]):
+                if len(pending) >= lookahead:
+                    break
+                if path not in pending:
+                    pending[path] = pool.submit(lister, path)
+
+            path, depth = stack.pop()
+            future = pending.pop(path, None)
+            subdirs = future.result() if future is not None else lister(path)
+            children = []
+            for name, full_path, is_link in subdirs:
+                if exclude is not None and exclude.fullmatch(name):
+                    continue
+                # os.walk처럼 심볼릭 링크 폴더는 목록에만 넣고 안으로 들어가지 않음
+                children.append((full_path, not is_link and (max_depth is None or depth + 1 < max_depth)))
+            yield path, depth, children
+            stack.extend((full_path, depth + 1) for full_path, descend in reversed(children) if descend)
+    finally:
+        for future in pending.values():
+            future.cancel()
+        pool.shutdown(wait=False)
+
+def iter_subfolders(folder_path, max_depth=None, exclude=None,
+                    workers=WALK_WORKERS, lookahead=WALK_LOOKAHEAD, snapshot=None):
+    """
+    folder_path 및 모든 하위 폴더를 순회하며,
+    디렉터리 경로를 하나씩 돌려줌(파일 제외). 목록을 메모리에 모으지 않음.
+    - 결과는 항상 같은 순서(이름순 깊이 우선, 상위 폴더가 먼저)로 나옴
+    - snapshot: FolderSnapshot을 주면 수정 시각이 그대로인 폴더는 다시 읽지 않음
+    """
+    lister = snapshot.list_subdirs if snapshot is not None else list_subdirs
+    for _, _, children in walk_folders(folder_path, max_depth, exclude, workers, lookahead, lister):
+        for full_path, _ in children:
+            yield full_path
+
+def iter_folder_stats(folder_path, max_depth=None, exclude=None,
+                      workers=WALK_WORKERS, lookahead=WALK_LOOKAHEAD, totals=None):
+    """
+    한 번의 순회로 하위 폴더마다 (경로, 파일 수, 전체 용량, 최근 수정 시각)을 돌려줌.
+    - 파일 수는 그 폴더 바로 안의 파일만, 전체 용량·최근 수정 시각은 하위 폴더 전체를 합친 값
+    - 행 순서는 iter_subfolders()와 같음. 상위 폴더의 합계는 하위 폴더를 모두 읽어야 정해지므로
+      합계가 아직 안 정해진 행부터 뒤의 행은 버퍼에 들고 있다가 앞에서부터 내보냄
+      (큰 하위 폴더 하나를 다 읽는 동안은 그 안의 행 수만큼 메모리를 씀)
+    - max_depth는 내보낼 행의 깊이만 제한함. 합계가 하위 폴더 전체를 담도록 순회는 끝까지 함
+    - 안으로 들어가지 않는 심볼릭 링크 폴더는 통계 없이 (경로, None, None, None)
+    - totals: dict를 주면 folder_path 자체의 합계('files', 'bytes', 'newest')를 채워 줌
     """
-    wb = load_workbook(file_path)
-    ws = wb[sheet_name]
+    stats = FolderStats()
+    open_folders = []   # [경로, 파일 수, 전체 바이트, 최근 수정 시각, 내보낼 행 또는 None] (깊이 순)
+    rows = deque()      # 내보낼 순서대로 [경로, 파일 수, 전체 용량, 최근 수정 시각, 합계가 정해졌는지]
+    waiting = {}        # 아직 방문하지 않은 하위 폴더 경로 -> 그 행
+
+    def shown(depth):
+        return max_depth is None or depth <= max_depth
+
+    def close_folder():
+        path, files, size, newest, row = open_folders.pop()
+        if open_folders:
+            parent = open_folders[-1]
+            parent[2] += size
+            if newest is not None and (parent[3] is None or newest > parent[3]):
+                parent[3] = newest
+        if row is not None:
+            row[1:] = [files, size, newest, True]
 
-    for cell in ws[target_col]:
-        if cell.value and isinstance(cell.value, str):
-            if cell.value.startswith(prefix_to_remove):
-                # 접두어 길이만큼 잘라내고 나머지 부분만 유지
-                cell.value = cell.value[len(prefix_to_remove):]
+    def ready_rows():
+        while rows and rows[0][4]:
+            yield tuple(rows.popleft()[:4])
 
-    wb.save(file_path)
+    for path, depth, children in walk_folders(folder_path, None, exclude, workers, lookahead,
+                                              stats.list_subdirs):
+        # 깊이 우선이라, 지금 폴더의 상위가 아닌 열린 폴더들은 이미 하위를 다 읽은 상태
+        while len(open_folders) > depth:
+            close_folder()
+        files, size, newest = stats.own.pop(path)
+        open_folders.append([path, files, size, newest, waiting.pop(path, None)])
+        if shown(depth + 1):
+            for full_path, descend in children:
+                # 안으로 들어가지 않는 심볼릭 링크 폴더는 통계 없이 바로 정해짐
+                row = [full_path, None, None, None, not descend]
+                rows.append(row)
+                if descend:
+                    waiting[full_path] = row
+        yield from ready_rows()
+    while len(open_folders) > 1:
+        close_folder()
+    yield from ready_rows()
+    if open_folders and totals is not None:
+        _, files, size, newest, _ = open_folders[0]
+        totals.update(files=files, bytes=size, newest=newest)
+
+def strip_prefix(path, prefix_to_remove):
+    """
+    path가 prefix_to_remove로 시작하면 접두어를 잘라낸 나머지를 돌려줌.
+    예) 'M:\\애니노블\\폴더이름' → '폴더이름'
+    """
+    if prefix_to_remove and path.startswith(prefix_to_remove):
+        return path[len(prefix_to_remove):]
+    return path
 
 def open_excel_file(file_path):
     """
@@ -44,43 +318,139 @@ def open_excel_file(file_path):
     else:
         subprocess.run(["xdg-open", file_path])  # Linux
 
-def export_subfolders_and_remove_prefix(folder_path, excel_path, prefix_to_remove):
+class SheetSplitter:
+    """
+    write-only 워크북에 행을 이어 붙이다가, 시트가 엑셀 최대 행 수에 닿으면
+    같은 헤더로 새 시트('Subfolders (2)' ...)를 만들어 계속 기록.
+    """
+
+    def __init__(self, wb, title, header, max_rows=EXCEL_MAX_ROWS):
+        self.wb = wb
+        self.title = title
+        self.header = header
+        self.max_rows = max_rows
+        self.sheet_count = 0
+        self.total = 0
+        self._new_sheet()
+
+    def _new_sheet(self):
+        self.sheet_count += 1
+        name = self.title if self.sheet_count == 1 else f"{self.title} ({self.sheet_count})"
+        self.ws = self.wb.create_sheet(name)
+        self.ws.append(self.header)
+        self.rows = 1
+
+    def append(self, row):
+        if self.rows >= self.max_rows:
+            self._new_sheet()
+        self.ws.append(row)
+        self.rows += 1
+        self.total += 1
+
+def export_subfolders_and_remove_prefix(folder_path, excel_path, prefix_to_remove, max_depth=None, exclude=None,
+                                        use_snapshot=False, with_stats=False, catalog_db=None):
     """
-    1) folder_path의 모든 하위 폴더를 찾아 엑셀에 기록.
-    2) 접두어(prefix_to_remove)가 있으면, 엑셀에서 해당 접두어를 제거.
+    1) folder_path의 하위 폴더를 찾는 대로 접두어(prefix_to_remove)를 떼고 바로 엑셀에 기록.
+       (write-only 워크북이라 폴더가 백만 개여도 메모리 사용량이 일정하고, 저장은 한 번)
+       with_stats이면 같은 순회에서 파일 수·전체 용량·최근 수정 시각 열을 추가
+       (이때 행 순서는 통계 없을 때와 같고, max_depth는 행의 깊이만 제한해
+        전체 용량은 항상 하위 폴더 전체를 합친 값. iter_folder_stats() 참고)
+       catalog_db를 주면 같은 경로들을 폴더 카탈로그(folder_catalog.py)에도 기록 (빈 문자열이면 기본 DB)
+    2) use_snapshot이면 지난 실행의 스냅샷과 비교해 바뀐 폴더만 다시 읽고,
+       추가·삭제·이름 변경 내역을 'Changes' 시트에 기록.
     3) 엑셀 파일을 자동으로 열기.
     """
-    # 1) 하위 폴더 수집
-    subfolders = collect_subfolders(folder_path)
+    if use_snapshot and with_stats:
+        # 스냅샷은 바뀌지 않은 폴더를 다시 읽지 않으므로 파일 통계를 모을 수 없음
+        raise ValueError("스냅샷과 폴더 통계는 함께 쓸 수 없습니다.")
+    snapshot = snapshot_file = options = None
+    if use_snapshot:
+        snapshot_file = snapshot_path_for(excel_path)
+        options = {"max_depth": max_depth, "exclude": sorted(exclude or [])}
+        snapshot = FolderSnapshot(load_snapshot(snapshot_file, folder_path, options))
 
-    # 2) 새 엑셀 만들기
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Subfolders"
+    # 1) 새 엑셀 만들기 (행을 바로 디스크로 흘려 보내는 write-only 모드)
+    wb = Workbook(write_only=True)
 
-    # 헤더(원하시는 대로 수정 가능)
-    ws.append(["폴더 경로"])
+    totals = {}
 
-    # 폴더 경로를 A열에 기록
-    for sf in subfolders:
-        ws.append([sf])
+    def write_rows(add_to_catalog=None):
+        # 헤더(원하시는 대로 수정 가능)
+        if with_stats:
+            sheet = SheetSplitter(wb, SHEET_TITLE, ["폴더 경로", "파일 수", "전체 용량(바이트)", "최근 수정"])
+            for sf, files, size, newest in iter_folder_stats(folder_path, max_depth, compile_excludes(exclude),
+                                                             totals=totals):
+                if add_to_catalog:
+                    add_to_catalog(sf)
+                sheet.append([strip_prefix(sf, prefix_to_remove), files, size,
+                              datetime.fromtimestamp(newest) if newest is not None else None])
+        else:
+            sheet = SheetSplitter(wb, SHEET_TITLE, ["폴더 경로"])
+
+            # 하위 폴더를 찾는 대로 접두어를 떼고 A열에 기록
+            for sf in iter_subfolders(folder_path, max_depth, compile_excludes(exclude), snapshot=snapshot):
+                if add_to_catalog:
+                    add_to_catalog(sf)
+                sheet.append([strip_prefix(sf, prefix_to_remove)])
+        return sheet
+
+    if catalog_db is not None:
+        # 카탈로그를 쓸 때만 불러옴
+        from folder_catalog import FolderCatalog
+        with FolderCatalog(catalog_db) as catalog, catalog.scan(folder_path) as add_to_catalog:
+            sheet = write_rows(add_to_catalog)
+            catalog_db = catalog.db_path
+    else:
+        sheet = write_rows()
+
+    # 2) 지난 스냅샷과의 차이
+    if snapshot is not None:
+        changes = []
+        if snapshot.previous:
+            changes = diff_snapshots(snapshot.previous, snapshot.entries, compile_excludes(exclude))
+        changes_sheet = SheetSplitter(wb, "Changes", ["구분", "폴더 경로", "이전 경로"])
+        for kind, path, old_path in changes:
+            changes_sheet.append([kind, strip_prefix(path, prefix_to_remove),
+                                  strip_prefix(old_path, prefix_to_remove)])
 
     # 저장
     wb.save(excel_path)
-    print(f"[완료] 엑셀 파일로 저장: {excel_path}")
-
-    # 3) 접두어 제거 (prefix_to_remove가 빈 문자열이면 생략)
+    print(f"[완료] 엑셀 파일로 저장: {excel_path} (폴더 {sheet.total:,}개, 시트 {sheet.sheet_count}개)")
     if prefix_to_remove:
-        remove_prefix_in_excel(file_path=excel_path,
-                               sheet_name="Subfolders",
-                               target_col="A",
-                               prefix_to_remove=prefix_to_remove)
         print(f"[완료] 접두어 '{prefix_to_remove}' 제거")
+    if catalog_db is not None:
+        print(f"[완료] 폴더 카탈로그에 기록: {catalog_db} (검색: python folder_catalog.py 검색어)")
+    if totals:
+        print(f"[완료] 전체 용량 {totals['bytes'] / 1024 ** 3:,.2f} GB ({totals['bytes']:,} 바이트)")
+    if snapshot is not None:
+        save_snapshot(snapshot_file, folder_path, options, snapshot.entries)
+        if snapshot.previous:
+            print(f"[완료] 다시 읽은 폴더 {snapshot.relisted:,}/{len(snapshot.entries):,}개, "
+                  f"변경 {len(changes):,}건 ('Changes' 시트)")
+        else:
+            print(f"[완료] 첫 스냅샷 저장: {snapshot_file}")
 
-    # 4) 엑셀 파일 열기
+    # 2) 엑셀 파일 열기
     open_excel_file(excel_path)
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="폴더 안의 모든 하위 폴더 경로를 엑셀로 저장")
+    parser.add_argument("--max-depth", type=int,
+                        help="이 깊이까지만 조사 (1 = 바로 아래 폴더만). --stats와 함께면 이 깊이까지만 행으로 쓰고 용량은 끝까지 합산")
+    parser.add_argument("--exclude", action="append", default=[],
+                        help="제외할 폴더 이름 패턴 (예: --exclude .git --exclude '*_backup'), 그 안도 조사하지 않음")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--snapshot", action="store_true",
+                      help="스냅샷으로 바뀐 폴더만 다시 읽고, 지난 실행과의 변경 내역을 'Changes' 시트에 기록")
+    mode.add_argument("--stats", action="store_true",
+                      help="폴더별 파일 수, 하위 포함 전체 용량, 최근 수정 시각 열 추가")
+    parser.add_argument("--catalog", nargs="?", const="", metavar="DB",
+                        help="폴더 경로를 검색용 카탈로그 DB에도 기록 (기본: folder_catalog.sqlite3)")
+    return parser.parse_args()
+
 def main():
+    args = parse_args()
+
     # 조사할 폴더 경로 입력
     folder_path = input("조사할 폴더 경로를 입력하세요: ").strip()
 
@@ -93,7 +463,8 @@ def main():
     prefix = input("제거할 접두어가 있으면 입력하세요 (예: M:\\애니노블\\). 없으면 엔터: ").strip()
 
     # 전체 작업 실행
-    export_subfolders_and_remove_prefix(folder_path, raw_excel_name, prefix)
+    export_subfolders_and_remove_prefix(folder_path, raw_excel_name, prefix, args.max_depth, args.exclude,
+                                        args.snapshot, args.stats, args.catalog)
 
 if __name__ == "__main__":
     main()
@@ -1,13 +1,16 @@
+import argparse
 import os
 
-def list_subfolders_two_depth(root_folder: str):
+def list_subfolders_two_depth(root_folder: str, catalog_db: str = None):
     """
     root_folder 기준으로 두 단계 아래(depth = 2)의 서브폴더만 출력
+    catalog_db를 주면 찾은 폴더 경로를 폴더 카탈로그(folder_catalog.py)에도 기록 (빈 문자열이면 기본 DB)
     """
     if not os.path.isdir(root_folder):
         raise NotADirectoryError(f"폴더가 존재하지 않습니다: {root_folder}")
 
     depth2_folders = []
+    depth2_paths = []
 
     # 1단계 탐색
     for first in os.listdir(root_folder):
@@ -19,6 +22,15 @@ def list_subfolders_two_depth(root_folder: str):
                 second_path = os.path.join(first_path, second)
                 if os.path.isdir(second_path):
                     depth2_folders.append(second)
+                    depth2_paths.append(second_path)
+
+    if catalog_db is not None:
+        # 카탈로그를 쓸 때만 불러옴
+        from folder_catalog import FolderCatalog
+        with FolderCatalog(catalog_db) as catalog, catalog.scan(root_folder) as add_to_catalog:
+            for path in depth2_paths:
+                add_to_catalog(path)
+            catalog_db = catalog.db_path
 
     print(f"\n📁 '{root_folder}' 두 단계 아래 서브폴더 목록:")
 
@@ -26,8 +38,15 @@ def list_subfolders_two_depth(root_folder: str):
         print(" -", f)
 
     print(f"\n총 {len(depth2_folders)}개 폴더가 있습니다.\n")
+    if catalog_db is not None:
+        print(f"폴더 카탈로그에 기록: {catalog_db} (검색: python folder_catalog.py 검색어)\n")
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="두 단계 아래 서브폴더 목록 출력")
+    parser.add_argument("--catalog", nargs="?", const="", metavar="DB",
+                        help="폴더 경로를 검색용 카탈로그 DB에도 기록 (기본: folder_catalog.sqlite3)")
+    args = parser.parse_args()
+
     root = input("부모 폴더 경로를 입력하세요: ").strip()
-    list_subfolders_two_depth(root)
+    list_subfolders_two_depth(root, args.catalog)
@@ -5,13 +5,36 @@
 엑셀 파일에 경로 등을 입력하고, 해당 내용을 읽어 실행하는 시스템
 """
 
+import time
+
+# --profile-startup: 모듈 실행 시작 시각 (인터프리터 기동 시간 계산 기준)
+_MODULE_T0 = time.perf_counter()
+
 import os
 import re
 import sys
+import codecs
+import hashlib
+import heapq
+import importlib
+import itertools
+import json
+import marshal
+import queue
+import runpy
+import shutil
+import sqlite3
+import stat
 import subprocess
-import time
+import tempfile
+import threading
+import traceback
+import unicodedata
+from collections import deque, namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait as wait_futures
+from contextlib import contextmanager, nullcontext
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 
 # UI 상수 (박스·폭)
 UI_WIDTH = 80
@@ -37,9 +60,18 @@ ICONS = {
     'fire': '🔥',
     'target': '🎯',
     'gem': '💎',
-    'lightning': '⚡'
+    'lightning': '⚡',
+    'hourglass': '⏳',
+    'reload': '🔄',
+    'alarm': '⏰',
+    'chain': '⛓️',
+    'log': '📜'
 }
 
+# 라이브러리 import 소요 시간 (--profile-startup 보고용)
+IMPORT_TIMES = {}
+
+_t0 = time.perf_counter()
 try:
     from colorama import init, Fore, Style, Back
     init(autoreset=True)
@@ -48,20 +80,773 @@ except ImportError:
     subprocess.check_call([sys.executable, "-m", "pip", "install", "colorama"])
     from colorama import init, Fore, Style, Back
     init(autoreset=True)
+IMPORT_TIMES["colorama"] = time.perf_counter() - _t0
 
-try:
-    import openpyxl
-    from openpyxl import Workbook
-except ImportError:
-    print("openpyxl 라이브러리가 필요합니다. 설치 중...")
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "openpyxl"])
-    import openpyxl
-    from openpyxl import Workbook
+_openpyxl = None
+
+
+def import_openpyxl():
+    """openpyxl 지연 import (엑셀을 실제로 읽거나 만들 때만 로드)"""
+    global _openpyxl
+    if _openpyxl is None:
+        t0 = time.perf_counter()
+        try:
+            import openpyxl
+        except ImportError:
+            print("openpyxl 라이브러리가 필요합니다. 설치 중...")
+            subprocess.check_call([sys.executable, "-m", "pip", "install", "openpyxl"])
+            import openpyxl
+        _openpyxl = openpyxl
+        IMPORT_TIMES["openpyxl"] = time.perf_counter() - t0
+    return _openpyxl
 
 
 # 엑셀 설정 파일명 (스크립트와 같은 폴더)
 EXCEL_FILENAME = "task_config.xlsx"
-EXCEL_HEADERS = ("번호", "제목", "설명", "파일경로")
+EXCEL_HEADERS = ("번호", "제목", "설명", "파일경로", "그룹", "일정", "선행작업")
+
+# 파싱된 작업 목록 캐시 (엑셀 크기·수정시각이 같으면 openpyxl 없이 바로 읽음)
+TASK_CACHE_FILENAME = ".task_config.cache"
+TASK_CACHE_VERSION = 4
+
+# 실행 옵션 파일 (스크립트와 같은 폴더, 없거나 비어 있으면 기본값)
+SETTINGS_FILENAME = "settings.json"
+DEFAULT_SETTINGS = {
+    "max_parallel": 4,      # 여러 작업을 한 번에 실행할 때 동시에 도는 최대 개수
+    "warm_workers": 0,      # .py 작업용 예열 워커 수 (0이면 매번 새 Python 실행)
+    "warm_imports": ["openpyxl", "matplotlib", "yfinance"],  # 워커가 미리 import할 모듈
+    "page_size": 0,         # 한 페이지에 보여 줄 작업 수 (0이면 콘솔 높이에 맞춤, 좁으면 한 줄 행으로)
+    "capture_output": False,  # .py 작업 출력을 새 콘솔 대신 logs/ 파일과 메뉴 미리보기로 받기
+    "log_max_kb": 1024,     # 작업별 로그 파일 최대 크기 (넘으면 .1, .2 ...로 회전)
+    "log_backups": 3,       # 보관할 회전 로그 수
+    "tail_lines": 200,      # 메모리에 남겨 둘 최근 출력 줄 수
+    "resident": False,      # 상주 모드: Q는 창만 숨기고, 다시 실행하면 떠 있는 런처 창을 바로 띄움
+}
+
+# 메인 화면에서 작업 카드 외에 차지하는 줄 수 (헤더 6 + 하단 메뉴 최대 10 + 입력 줄 1)
+MENU_CHROME_LINES = 17
+# 카드 한 장의 줄 수 (내용 4 + 구분선 1, 마지막 카드는 구분선 없음)
+TASK_CARD_LINES = 5
+# 콘솔 높이에 맞출 때 카드가 이보다 적게 들어가면 한 줄짜리 작업 행으로 보여 줌
+PAGE_SIZE_MIN = 8
+
+# 예열 워커에 전달하는 접속 정보 (환경 변수, 워커가 읽은 뒤 바로 지움)
+WORKER_ADDRESS_ENV = "TASK_LAUNCHER_WORKER_ADDRESS"
+WORKER_KEY_ENV = "TASK_LAUNCHER_WORKER_KEY"
+WORKER_IMPORTS_ENV = "TASK_LAUNCHER_WORKER_IMPORTS"
+
+# 상주 런처 접속 이름 (사용자별: Windows는 named pipe, 그 외는 임시 폴더의 유닉스 소켓)
+RESIDENT_NAME = "jp_task_launcher"
+
+# 실행 기록 (작업별 실행 시간 p50/p95, 마지막 결과)
+RUN_HISTORY_FILENAME = "run_history.sqlite3"
+RUN_HISTORY_STATS_LIMIT = 200   # 통계에 쓰는 작업별 최근 실행 수
+
+# 출력 캡처: 로그 폴더, 한 번에 읽는 최대 바이트 (줄바꿈 없는 긴 출력도 메모리 제한)
+LOG_DIRNAME = "logs"
+CAPTURE_READ_LIMIT = 64 * 1024
+
+# 다중 선택 토큰: 3 또는 5-8
+SELECTION_RANGE_RE = re.compile(r"^(\d+)(?:-(\d+))?$")
+
+# 일정 열 형식: '매일 09:00', '평일 08:30, 18:00', '30분마다', 'every 2h'
+SCHEDULE_TIME_RE = re.compile(r"(\d{1,2}):(\d{2})")
+SCHEDULE_INTERVAL_RE = re.compile(r"(\d+)\s*(분|시간|minutes?|min|m|hours?|h)(?![a-z])", re.IGNORECASE)
+# 시각·간격을 뺀 나머지로 허용하는 말 (그 밖의 말이 있으면 '매주 월 09:00'처럼 지원하지 않는 일정)
+SCHEDULE_DAILY_WORDS = {"", "매일", "daily", "평일", "weekday", "weekdays"}
+SCHEDULE_INTERVAL_WORDS = {"", "마다", "매", "every"}
+
+# 일정: times는 하루 중 실행 시각 (시, 분) 목록, interval은 반복 간격(초)
+Schedule = namedtuple("Schedule", "times interval weekdays_only")
+
+# 병렬 실행 결과 (번호, 제목, 실행 지연 ms, 소요 시간 s, 종료 코드, 오류)
+TaskRunResult = namedtuple("TaskRunResult", "number name spawn_ms wall_s exit_code error")
+
+# 작업 파일 상태 조회 (작업당 os.stat 1회, 스레드 풀 + 짧은 TTL 캐시)
+STATUS_TTL = 5.0        # 상태 캐시 유효 시간(초)
+STATUS_WORKERS = 8      # 동시에 stat 하는 최대 스레드 수
+STATUS_WAIT = 0.3       # 화면 그릴 때 느린 드라이브를 기다리는 최대 시간(초)
+
+# 엑셀 변경 감시 주기(초): 수정시각·크기만 확인하고, 두 번 연속 같을 때(저장 완료) 다시 읽음
+WATCH_INTERVAL = 1.0
+# 입력 대기 중 백그라운드 변경(엑셀 재로딩, 파일 상태)을 화면에 반영하는 주기(초)
+INPUT_IDLE_INTERVAL = 0.1
+
+FileStatus = namedtuple("FileStatus", "exists is_dir mtime")
+MISSING_STATUS = FileStatus(False, False, None)
+
+
+def load_settings(script_dir):
+    """settings.json 읽기 (없거나 형식이 맞지 않으면 기본값)"""
+    settings = dict(DEFAULT_SETTINGS)
+    try:
+        with open(Path(script_dir) / SETTINGS_FILENAME, encoding="utf-8-sig") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return settings
+    if isinstance(data, dict):
+        settings.update(data)
+    return settings
+
+
+def parse_task_selection(text, tasks):
+    """'1,3,5-8', '@그룹' 형식의 선택을 작업 인덱스 목록으로 변환 (입력 순서 유지, 중복 제거)"""
+    indices = []
+    for token in re.split(r"[,\s]+", text.strip()):
+        if not token:
+            continue
+        if token.startswith("@"):
+            group = token[1:].casefold()
+            matched = [i for i, task in enumerate(tasks)
+                       if group and group in {g.strip().casefold() for g in task.get("group", "").split(",")}]
+            if not matched:
+                raise ValueError(f"'{token[1:]}' 그룹에 속한 작업이 없습니다")
+            indices.extend(matched)
+            continue
+        m = SELECTION_RANGE_RE.match(token)
+        if not m:
+            raise ValueError(f"알 수 없는 선택입니다: {token}")
+        start, end = int(m.group(1)), int(m.group(2) or m.group(1))
+        if start > end:
+            start, end = end, start
+        if start < 1 or end > len(tasks):
+            raise ValueError(f"번호 범위를 벗어났습니다: {token} (1-{len(tasks)})")
+        indices.extend(range(start - 1, end))
+    if not indices:
+        raise ValueError("선택된 작업이 없습니다")
+    return list(dict.fromkeys(indices))
+
+
+def resolve_dependencies(tasks):
+    """'선행작업' 열(번호 또는 제목, 쉼표 구분)을 작업 인덱스 -> 선행 인덱스 집합으로 변환"""
+    by_name = {}
+    for i, task in enumerate(tasks):
+        by_name.setdefault(task.get("name", "").casefold(), i)
+    deps = {}
+    for i, task in enumerate(tasks):
+        parents = set()
+        for token in re.split(r"[,\n]+", task.get("depends", "")):
+            token = token.strip()
+            if not token:
+                continue
+            if token.isdigit() and 1 <= int(token) <= len(tasks):
+                parent = int(token) - 1
+            elif token.casefold() in by_name:
+                parent = by_name[token.casefold()]
+            else:
+                raise ValueError(f"【{i + 1}】 {task.get('name', '')}: 선행작업 '{token}'을(를) 찾을 수 없습니다")
+            if parent == i:
+                raise ValueError(f"【{i + 1}】 {task.get('name', '')}: 자기 자신을 선행작업으로 지정했습니다")
+            parents.add(parent)
+        deps[i] = parents
+    return deps
+
+
+def pipeline_order(targets, deps):
+    """대상 작업과 그 선행작업 전체를 위상 정렬 (Kahn). 순환이 있으면 ValueError"""
+    nodes, stack = set(), list(targets)
+    while stack:
+        i = stack.pop()
+        if i not in nodes:
+            nodes.add(i)
+            stack.extend(deps.get(i, ()))
+    indegree = {i: len(deps.get(i, ())) for i in nodes}
+    children = {i: [] for i in nodes}
+    for i in nodes:
+        for parent in deps.get(i, ()):
+            children[parent].append(i)
+    ready = sorted(i for i in nodes if indegree[i] == 0)
+    order = []
+    while ready:
+        i = ready.pop(0)
+        order.append(i)
+        for child in sorted(children[i]):
+            indegree[child] -= 1
+            if indegree[child] == 0:
+                ready.append(child)
+    if len(order) != len(nodes):
+        cycle = sorted(i + 1 for i in nodes if indegree[i] > 0)
+        raise ValueError(f"선행작업이 순환합니다: {', '.join(map(str, cycle))}")
+    return order
+
+
+def display_width(text):
+    """터미널 표시 폭 (한글·이모지 등 넓은 문자는 2칸)"""
+    return sum(2 if unicodedata.east_asian_width(ch) in ("W", "F") else 1 for ch in text)
+
+
+def fit_display(text, width):
+    """표시 폭 width에 맞춰 자르거나 공백으로 채움"""
+    out, used = [], 0
+    for ch in text:
+        w = display_width(ch)
+        if used + w > width:
+            break
+        out.append(ch)
+        used += w
+    return "".join(out) + " " * (width - used)
+
+
+def format_duration(seconds):
+    """소요 시간 짧게 표시 (예: 3.2s, 2m05s, 1h03m)"""
+    if seconds < 60:
+        return f"{seconds:.1f}s"
+    minutes, sec = divmod(int(seconds), 60)
+    if minutes < 60:
+        return f"{minutes}m{sec:02d}s"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h{minutes:02d}m"
+
+
+def percentile(sorted_values, pct):
+    """정렬된 값의 백분위수 (nearest-rank)"""
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+RunStats = namedtuple("RunStats", "p50 p95 last_exit_code runs")
+
+
+class RunHistory:
+    """작업 실행 기록 저장소 (SQLite, 추가만 함). 작업 경로별 통계는 새 기록이 생길 때까지 메모리에 캐시"""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.updated = threading.Event()   # 새 기록이 생기면 set (대시보드 다시 그리기용)
+        self._lock = threading.Lock()
+        self._conn = None
+        self._stats = None
+
+    def _connect(self):
+        if self._conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=5, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS runs (
+                    id INTEGER PRIMARY KEY,
+                    task TEXT NOT NULL,
+                    path TEXT NOT NULL,
+                    started_at REAL NOT NULL,
+                    spawn_ms REAL,
+                    duration_s REAL,
+                    exit_code INTEGER
+                )""")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_runs_path ON runs (path, started_at)")
+            self._conn = conn
+        return self._conn
+
+    def record(self, task, path, started_at, spawn_ms, duration_s, exit_code):
+        """실행 한 건 기록 (duration_s/exit_code는 기다릴 수 없는 실행이면 None)"""
+        with self._lock:
+            try:
+                conn = self._connect()
+                with conn:
+                    conn.execute(
+                        "INSERT INTO runs (task, path, started_at, spawn_ms, duration_s, exit_code)"
+                        " VALUES (?, ?, ?, ?, ?, ?)",
+                        (task, path, started_at, spawn_ms, duration_s, exit_code))
+            except sqlite3.Error:
+                return
+            self._stats = None
+        self.updated.set()
+
+    def get_stats(self, path):
+        """작업 경로의 RunStats (최근 실행 기준). 기록이 없으면 None"""
+        with self._lock:
+            if self._stats is None:
+                try:
+                    self._stats = self._load_stats()
+                except sqlite3.Error:
+                    self._stats = {}
+            return self._stats.get(path)
+
+    def _load_stats(self):
+        rows = self._connect().execute("""
+            SELECT path, duration_s, exit_code FROM (
+                SELECT path, duration_s, exit_code,
+                       ROW_NUMBER() OVER (PARTITION BY path ORDER BY started_at DESC) AS rn
+                FROM runs
+            ) WHERE rn <= ? ORDER BY path, rn""", (RUN_HISTORY_STATS_LIMIT,))
+        grouped = {}
+        for path, duration_s, exit_code in rows:
+            grouped.setdefault(path, []).append((duration_s, exit_code))
+        stats = {}
+        for path, runs in grouped.items():
+            durations = sorted(d for d, _ in runs if d is not None)
+            p50 = percentile(durations, 50) if durations else None
+            p95 = percentile(durations, 95) if durations else None
+            stats[path] = RunStats(p50, p95, runs[0][1], len(runs))
+        return stats
+
+
+def parse_schedule(text):
+    """일정 열 해석 (예: '매일 09:00', '평일 08:30, 18:00', '30분마다', 'every 2h').
+    비어 있으면 None, 알 수 없는 형식이면 ValueError"""
+    text = str(text or "").strip()
+    if not text:
+        return None
+    times = [(int(h), int(m)) for h, m in SCHEDULE_TIME_RE.findall(text)]
+    if times:
+        if any(h > 23 or m > 59 for h, m in times):
+            raise ValueError(f"시각이 올바르지 않습니다: {text}")
+        words = set(re.split(r"[\s,]+", SCHEDULE_TIME_RE.sub(" ", text).strip().lower()))
+        if not words <= SCHEDULE_DAILY_WORDS:
+            raise ValueError(f"일정 형식을 알 수 없습니다: {text}")
+        weekdays_only = "평일" in words or "weekday" in words or "weekdays" in words
+        return Schedule(tuple(sorted(set(times))), None, weekdays_only)
+    m = SCHEDULE_INTERVAL_RE.search(text)
+    if m:
+        rest = (text[:m.start()] + " " + text[m.end():]).strip().lower()
+        if not set(rest.split()) <= SCHEDULE_INTERVAL_WORDS:
+            raise ValueError(f"일정 형식을 알 수 없습니다: {text}")
+        amount, unit = int(m.group(1)), m.group(2).lower()
+        seconds = amount * (60 if unit == "분" or unit.startswith("m") else 3600)
+        if seconds <= 0:
+            raise ValueError(f"반복 간격이 올바르지 않습니다: {text}")
+        return Schedule((), seconds, False)
+    raise ValueError(f"일정 형식을 알 수 없습니다: {text}")
+
+
+def next_due_time(schedule, after):
+    """after(epoch 초) 이후 처음 돌아오는 실행 시각(epoch 초)"""
+    if schedule.interval:
+        return after + schedule.interval
+    base = datetime.fromtimestamp(after)
+    for offset in range(8):
+        day = (base + timedelta(days=offset)).date()
+        if schedule.weekdays_only and day.weekday() >= 5:
+            continue
+        for hour, minute in schedule.times:
+            due = datetime(day.year, day.month, day.day, hour, minute).timestamp()
+            if due > after:
+                return due
+    return None
+
+
+class TaskScheduler(threading.Thread):
+    """일정이 있는 작업을 정해진 시각에 실행. 힙(우선순위 큐)의 가장 이른 시각까지 잠들었다가 깨어남"""
+
+    def __init__(self, on_due):
+        super().__init__(daemon=True, name="task-scheduler")
+        self.on_due = on_due
+        self._cond = threading.Condition()
+        self._heap = []     # (실행 시각, 순번, 키, Schedule, 작업)
+        self._due = {}      # 키 -> 다음 실행 시각 (목록이 다시 로딩돼도 유지)
+        self._seq = itertools.count()
+        self._stopped = False
+
+    def set_tasks(self, tasks):
+        """작업 목록으로 일정 큐를 다시 만듦. 일정이 그대로인 작업은 다음 실행 시각 유지"""
+        now = time.time()
+        with self._cond:
+            old_due, self._due, self._heap = self._due, {}, []
+            for task in tasks:
+                try:
+                    schedule = parse_schedule(task.get('schedule'))
+                except ValueError:
+                    continue
+                if schedule is None:
+                    continue
+                key = (task.get('name', ''), task.get('path', ''), task.get('schedule', ''))
+                if key in self._due:
+                    continue
+                due = old_due.get(key) or next_due_time(schedule, now)
+                if due is None:
+                    continue
+                self._due[key] = due
+                heapq.heappush(self._heap, (due, next(self._seq), key, schedule, task))
+            self._cond.notify()
+
+    def next_run(self):
+        """(다음 실행 시각, 작업). 일정이 없으면 None"""
+        with self._cond:
+            if not self._heap:
+                return None
+            return self._heap[0][0], self._heap[0][4]
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+
+    def run(self):
+        with self._cond:
+            while not self._stopped:
+                if not self._heap:
+                    self._cond.wait()
+                    continue
+                due, _, key, schedule, task = self._heap[0]
+                delay = due - time.time()
+                if delay > 0:
+                    # 다음 실행 시각까지 잠듦 (목록 변경·중지 시 notify로 깨어남)
+                    self._cond.wait(delay)
+                    continue
+                heapq.heappop(self._heap)
+                next_due = next_due_time(schedule, max(time.time(), due))
+                if next_due is not None:
+                    self._due[key] = next_due
+                    heapq.heappush(self._heap, (next_due, next(self._seq), key, schedule, task))
+                threading.Thread(target=self.on_due, args=(task, due), daemon=True,
+                                 name="scheduled-run").start()
+
+
+def fuzzy_score(query, text):
+    """query의 글자가 text에 순서대로 모두 있으면 점수(클수록 잘 맞음), 없으면 None"""
+    pos = text.find(query)
+    if pos >= 0:
+        return 1000 - min(pos, 999)  # 연속으로 포함되면 가장 높은 점수
+    score, start, prev = 0, 0, -2
+    for ch in query:
+        i = text.find(ch, start)
+        if i < 0:
+            return None
+        score += 10 if i == prev + 1 else 1
+        prev, start = i, i + 1
+    return score
+
+
+class TaskIndex:
+    """작업 제목·설명·경로 검색 인덱스. 검색어를 이어서 입력하면 직전 결과 안에서만 다시 찾음"""
+
+    def __init__(self, tasks):
+        self.tasks = tasks
+        self._entries = []
+        for task in tasks:
+            name = task.get('name', '').casefold()
+            text = " ".join((name, task.get('desc', '').casefold(), task.get('path', '').casefold()))
+            self._entries.append((name, text))
+        self._last_key = None
+        self._last_hits = None
+
+    def search(self, query):
+        """검색어(공백으로 나눈 단어 모두 포함)에 맞는 작업 인덱스를 잘 맞는 순서로 반환"""
+        terms = query.casefold().split()
+        if not terms:
+            return list(range(len(self.tasks)))
+        key = " ".join(terms)
+        if self._last_key and key.startswith(self._last_key):
+            candidates = self._last_hits   # 검색어가 길어지면 결과는 이전 결과의 부분집합
+        else:
+            candidates = range(len(self._entries))
+        scored = []
+        for i in candidates:
+            name, text = self._entries[i]
+            total = 0
+            for term in terms:
+                score = fuzzy_score(term, text)
+                if score is None:
+                    break
+                if fuzzy_score(term, name) is not None:
+                    total += 500   # 제목에서 맞으면 우선
+                total += score
+            else:
+                scored.append((-total, i))
+        self._last_key = key
+        self._last_hits = [i for _, i in scored]
+        scored.sort()
+        return [i for _, i in scored]
+
+
+def probe_file_status(filepath):
+    """os.stat 한 번으로 존재 여부·폴더 여부·수정시각 조회"""
+    try:
+        st = os.stat(filepath)
+    except (OSError, ValueError):
+        return MISSING_STATUS
+    return FileStatus(True, stat.S_ISDIR(st.st_mode), st.st_mtime)
+
+
+def get_process_age():
+    """현재 프로세스가 생성된 뒤 지난 시간(초). 알 수 없으면 None"""
+    try:
+        if os.name == 'nt':
+            import ctypes
+            from ctypes import wintypes
+            creation, exited, kernel, user = (wintypes.FILETIME() for _ in range(4))
+            kernel32 = ctypes.windll.kernel32
+            if not kernel32.GetProcessTimes(kernel32.GetCurrentProcess(), ctypes.byref(creation),
+                                            ctypes.byref(exited), ctypes.byref(kernel), ctypes.byref(user)):
+                return None
+            # FILETIME: 1601-01-01 기준 100ns 단위
+            ticks = (creation.dwHighDateTime << 32) | creation.dwLowDateTime
+            return time.time() - (ticks / 1e7 - 11644473600)
+        with open('/proc/self/stat') as f:
+            start_ticks = int(f.read().rsplit(')', 1)[1].split()[19])
+        with open('/proc/uptime') as f:
+            uptime = float(f.read().split()[0])
+        return uptime - start_ticks / os.sysconf('SC_CLK_TCK')
+    except Exception:
+        return None
+
+
+class StartupProfiler:
+    """--profile-startup: 시작 단계별 소요 시간 측정 및 보고"""
+
+    def __init__(self):
+        self.phases = []
+
+    @contextmanager
+    def phase(self, name):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - t0))
+
+    def print_report(self):
+        """단계별 소요 시간 표 출력"""
+        rows = []
+        process_age = get_process_age()
+        if process_age is not None:
+            # 프로세스 생성 ~ 이 모듈 첫 줄 실행까지
+            rows.append(("인터프리터 시작", max(0.0, process_age - (time.perf_counter() - _MODULE_T0))))
+        else:
+            rows.append(("인터프리터 시작", None))
+        for name in ("colorama", "openpyxl"):
+            if name in IMPORT_TIMES:
+                rows.append((f"{name} import", IMPORT_TIMES[name]))
+            else:
+                rows.append((f"{name} import", None))
+        rows.extend(self.phases)
+
+        # openpyxl import는 엑셀 읽기 단계 안에서 일어나므로 합계에서 제외
+        total = sum(sec for name, sec in rows if sec is not None and name != "openpyxl import")
+        print(f"{Fore.LIGHTCYAN_EX}{'─' * 60}{Style.RESET_ALL}")
+        print(f"{Fore.LIGHTYELLOW_EX}{ICONS['clock']} 시작 단계별 소요 시간{Style.RESET_ALL}")
+        for name, sec in rows:
+            value = "   측정 안 됨" if sec is None else f"{sec * 1000:8.1f} ms"
+            print(f"  {value}  {name}")
+        print(f"  {total * 1000:8.1f} ms  {Style.BRIGHT}합계{Style.RESET_ALL}")
+        if "openpyxl" in IMPORT_TIMES:
+            print(f"{Fore.LIGHTBLACK_EX}  (openpyxl import는 엑셀 읽기 단계 시간에 포함){Style.RESET_ALL}")
+        print(f"{Fore.LIGHTCYAN_EX}{'─' * 60}{Style.RESET_ALL}\n")
+
+
+class Spinner:
+    """백그라운드 스레드에서 도는 로딩 스피너 (with 블록의 작업이 끝나면 바로 멈춤).
+    스피너 줄과 섞이지 않도록, 블록 안의 작업은 출력하지 말고 메시지를 돌려받아 블록이 끝난 뒤 출력"""
+
+    FRAMES = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
+
+    def __init__(self, message="처리 중", interval=0.1, stream=None):
+        self.message = message
+        self.interval = interval
+        self._out = stream or sys.stdout
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._spin, daemon=True)
+
+    def _spin(self):
+        i = 0
+        while True:
+            frame = self.FRAMES[i % len(self.FRAMES)]
+            print(f"\r{Fore.CYAN}{frame} {self.message}...{Style.RESET_ALL}", end="", flush=True, file=self._out)
+            i += 1
+            if self._stop.wait(self.interval):
+                break
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._stop.set()
+        self._thread.join()
+        print(f"\r{' ' * (len(self.message) + 10)}\r", end="", flush=True, file=self._out)
+        return False
+
+
+# 화면 제어 ANSI 시퀀스 (Windows 기본 콘솔에서는 colorama가 변환)
+ANSI_COLOR_RE = re.compile(r"\033\[[0-9;]*m")
+ANSI_CLEAR_SCREEN = "\033[2J\033[H"
+ANSI_CLEAR_LINE_END = "\033[K"
+ANSI_CLEAR_BELOW = "\033[J"
+
+
+class FrameRenderer:
+    """대시보드 한 화면을 버퍼에 모아 한 번에 출력. 직전 화면과 달라진 줄만 다시 씀"""
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+        self.prev_lines = None
+
+    def invalidate(self):
+        """메뉴 밖 출력(실행 결과, 입력 안내 등)이 화면을 덮었을 때: 다음엔 전체 다시 그림"""
+        self.prev_lines = None
+
+    def render(self, lines):
+        """lines를 화면에 반영 (출력은 write 한 번)"""
+        height = shutil.get_terminal_size().lines
+        prev = self.prev_lines
+        buf = []
+        if prev is None or len(lines) >= height or len(prev) >= height:
+            # 화면 상태를 모르거나 스크롤되는 긴 화면: 전체 다시 그림
+            buf.append(ANSI_CLEAR_SCREEN)
+            buf.append("\n".join(lines))
+            buf.append("\n")
+        else:
+            for row, line in enumerate(lines):
+                if row >= len(prev) or prev[row] != line:
+                    buf.append(f"\033[{row + 1};1H{line}{ANSI_CLEAR_LINE_END}")
+            # 화면 아래(이전 입력 줄 등) 지우고 커서를 입력 위치로
+            buf.append(f"\033[{len(lines) + 1};1H{ANSI_CLEAR_BELOW}")
+        self.stream.write("".join(buf))
+        self.stream.flush()
+        self.prev_lines = list(lines)
+
+
+class LineReader:
+    """한 줄 입력을 글자 단위로 읽음. 입력을 기다리는 동안 on_idle()로 화면을 갱신할 수 있음"""
+
+    def __init__(self):
+        try:
+            self.interactive = sys.stdin.isatty() and sys.stdout.isatty()
+        except (AttributeError, ValueError):
+            self.interactive = False
+
+    def read_line(self, prompt, on_idle=None, on_change=None):
+        """prompt를 보여 주고 Enter까지 읽음.
+        on_idle()은 입력 대기 중, on_change(buf)는 글자가 바뀔 때마다 호출되며 True면 입력 줄을 다시 그림"""
+        if not self.interactive:
+            return input(prompt)
+        if os.name == 'nt':
+            return self._read_line_windows(prompt, on_idle, on_change)
+        return self._read_line_posix(prompt, on_idle, on_change)
+
+    def _redraw(self, prompt, buf):
+        sys.stdout.write(f"\r{prompt}{buf}{ANSI_CLEAR_LINE_END}")
+        sys.stdout.flush()
+
+    def _feed(self, ch, buf):
+        """글자 하나 처리. (새 버퍼, 입력 완료 여부)"""
+        if ch in ("\r", "\n"):
+            return buf, True
+        if ch in ("\x08", "\x7f"):
+            return buf[:-1], False
+        if ch == "\x03":
+            raise KeyboardInterrupt
+        if ch == "\x1a" or ch == "\x04":
+            raise EOFError
+        if ch.isprintable():
+            return buf + ch, False
+        return buf, False
+
+    def _read_line_windows(self, prompt, on_idle, on_change):
+        import msvcrt
+        buf = ""
+        self._redraw(prompt, buf)
+        while True:
+            if not msvcrt.kbhit():
+                if on_idle is not None and on_idle():
+                    self._redraw(prompt, buf)
+                time.sleep(INPUT_IDLE_INTERVAL)
+                continue
+            ch = msvcrt.getwch()
+            if ch in ("\x00", "\xe0"):
+                msvcrt.getwch()  # 방향키 등 특수키는 무시
+                continue
+            old_buf = buf
+            buf, done = self._feed(ch, buf)
+            if done:
+                sys.stdout.write("\n")
+                return buf
+            if buf != old_buf and on_change is not None:
+                on_change(buf)
+            self._redraw(prompt, buf)
+
+    def _read_line_posix(self, prompt, on_idle, on_change):
+        import select
+        import termios
+        import tty
+        fd = sys.stdin.fileno()
+        old_attrs = termios.tcgetattr(fd)
+        decoder = codecs.getincrementaldecoder(sys.stdin.encoding or "utf-8")(errors="replace")
+        buf = ""
+        in_escape = False
+        try:
+            tty.setcbreak(fd)
+            self._redraw(prompt, buf)
+            while True:
+                ready, _, _ = select.select([fd], [], [], INPUT_IDLE_INTERVAL)
+                if not ready:
+                    if on_idle is not None and on_idle():
+                        self._redraw(prompt, buf)
+                    continue
+                data = os.read(fd, 64)
+                if not data:
+                    raise EOFError
+                old_buf = buf
+                for ch in decoder.decode(data):
+                    # 방향키 등 ESC 시퀀스는 무시
+                    if ch == "\x1b":
+                        in_escape = True
+                        continue
+                    if in_escape:
+                        if ch.isalpha() or ch == "~":
+                            in_escape = False
+                        continue
+                    buf, done = self._feed(ch, buf)
+                    if done:
+                        sys.stdout.write("\n")
+                        return buf
+                if buf != old_buf and on_change is not None:
+                    on_change(buf)
+                self._redraw(prompt, buf)
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, old_attrs)
+
+
+class WorkbookWatcher(threading.Thread):
+    """task_config.xlsx 변경 감시: 크기·수정시각이 바뀌고 저장이 끝나면 백그라운드에서 다시 파싱"""
+
+    def __init__(self, launcher, interval=WATCH_INTERVAL):
+        super().__init__(daemon=True, name="workbook-watcher")
+        self.launcher = launcher
+        self.interval = interval
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self._pending = None    # (서명, 작업 목록)
+
+    def stop(self):
+        self._stop_event.set()
+
+    def take_pending(self):
+        """다시 읽은 (서명, 작업 목록). 없으면 None"""
+        with self._lock:
+            pending, self._pending = self._pending, None
+        return pending
+
+    def run(self):
+        last_seen = None
+        while not self._stop_event.wait(self.interval):
+            signature = self.launcher.get_excel_signature()
+            if signature is None or signature == self.launcher.loaded_signature:
+                last_seen = signature
+                continue
+            if signature != last_seen:
+                # 방금 바뀜: 저장(또는 동기화)이 끝날 때까지 한 주기 더 기다림
+                last_seen = signature
+                continue
+            with self._lock:
+                if self._pending is not None and self._pending[0] == signature:
+                    continue
+            try:
+                tasks = self.launcher.parse_tasks_from_workbook()
+            except Exception:
+                continue  # 저장 중이거나 잠긴 파일: 다음 주기에 재시도
+            self.launcher.write_task_cache(signature, tasks)
+            with self._lock:
+                self._pending = (signature, tasks)
+
+
+def set_console_title(title):
+    """Windows 콘솔 제목 설정 (cmd 'title' 대신 API 호출로 셸 실행 비용 제거)"""
+    if os.name != 'nt':
+        return
+    try:
+        import ctypes
+        ctypes.windll.kernel32.SetConsoleTitleW(title)
+    except Exception:
+        pass
 
 
 def setup_console_appearance():
@@ -132,22 +917,469 @@ def setup_console_appearance():
         pass
 
 
+def show_own_console_window():
+    """Windows: 숨겨진 채로 띄운 워커 콘솔 창을 보이게 하고 앞으로 가져옴"""
+    if os.name != 'nt':
+        return
+    try:
+        import ctypes
+        hwnd = ctypes.windll.kernel32.GetConsoleWindow()
+        if hwnd:
+            ctypes.windll.user32.ShowWindow(hwnd, 5)  # SW_SHOW
+            ctypes.windll.user32.SetForegroundWindow(hwnd)
+    except Exception:
+        pass
+
+
+def resident_endpoint():
+    """상주 런처 (주소, 소켓 종류, 인증키 파일 경로)"""
+    user = re.sub(r"\W", "_", os.environ.get("USERNAME") or os.environ.get("USER") or "user")
+    tmp = Path(tempfile.gettempdir())
+    key_path = tmp / f"{RESIDENT_NAME}_{user}.key"
+    if os.name == 'nt':
+        return rf"\\.\pipe\{RESIDENT_NAME}_{user}", "AF_PIPE", key_path
+    return str(tmp / f"{RESIDENT_NAME}_{user}.sock"), "AF_UNIX", key_path
+
+
+def signal_resident():
+    """떠 있는 상주 런처에 창을 띄우라고 알림. 전달했으면 True (상주 런처가 없으면 False)"""
+    from multiprocessing.connection import Client
+
+    address, family, key_path = resident_endpoint()
+    try:
+        authkey = bytes.fromhex(key_path.read_text(encoding="ascii").strip())
+        conn = Client(address, family=family, authkey=authkey)
+        try:
+            conn.send("show")
+            return conn.recv() == "ok"
+        finally:
+            conn.close()
+    except Exception:
+        return False
+
+
+class ResidentServer(threading.Thread):
+    """상주 모드에서 다음 실행이 보내는 '창 띄우기' 요청을 받는 스레드"""
+
+    def __init__(self):
+        from multiprocessing.connection import Listener
+
+        super().__init__(daemon=True, name="resident-server")
+        self.address, self.family, self.key_path = resident_endpoint()
+        if self.family == "AF_UNIX" and os.path.exists(self.address):
+            if self._socket_alive(self.address):
+                raise RuntimeError("이미 다른 상주 런처가 실행 중입니다")
+            os.unlink(self.address)     # 비정상 종료로 남은 소켓 파일
+        authkey = os.urandom(32)
+        fd = os.open(self.key_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="ascii") as f:
+            f.write(authkey.hex())
+        self.listener = Listener(self.address, family=self.family, authkey=authkey)
+        self.show_requested = threading.Event()
+        self._closed = False
+
+    @staticmethod
+    def _socket_alive(address):
+        """소켓 파일에 받는 쪽이 있는지 (접속이 거부되면 남은 파일)"""
+        import socket
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(1.0)
+        try:
+            sock.connect(address)
+            return True
+        except (ConnectionRefusedError, FileNotFoundError):
+            return False
+        except OSError:
+            return True     # 시간 초과 등: 살아 있을 수 있으니 지우지 않음
+        finally:
+            sock.close()
+
+    def run(self):
+        while not self._closed:
+            try:
+                conn = self.listener.accept()
+            except OSError:
+                if self._closed:
+                    return
+                continue
+            except Exception:
+                continue    # 인증 실패 등
+            try:
+                if conn.recv() == "show":
+                    self.show_requested.set()
+                    conn.send("ok")
+            except (EOFError, OSError):
+                pass
+            finally:
+                conn.close()
+
+    def stop(self):
+        self._closed = True
+        try:
+            self.listener.close()
+        except OSError:
+            pass
+        paths = [self.key_path] + ([self.address] if self.family == "AF_UNIX" else [])
+        for path in paths:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+
+def hide_own_console_window():
+    """Windows: 런처 콘솔 창 숨기기 (상주 모드에서 Q)"""
+    if os.name != 'nt':
+        return
+    try:
+        import ctypes
+        hwnd = ctypes.windll.kernel32.GetConsoleWindow()
+        if hwnd:
+            ctypes.windll.user32.ShowWindow(hwnd, 0)  # SW_HIDE
+    except Exception:
+        pass
+
+
+def run_warm_worker():
+    """--warm-worker: 무거운 모듈을 미리 import해 두고, 런처가 보낸 스크립트 하나를 실행한 뒤 종료"""
+    from multiprocessing.connection import Client
+    from colorama import deinit
+
+    address = os.environ.pop(WORKER_ADDRESS_ENV)
+    authkey = bytes.fromhex(os.environ.pop(WORKER_KEY_ENV))
+    for name in filter(None, os.environ.pop(WORKER_IMPORTS_ENV, "").split(",")):
+        try:
+            importlib.import_module(name)
+        except Exception:
+            pass  # 설치 안 된 모듈은 작업 스크립트가 직접 import할 때 처리
+
+    conn = Client(address, authkey=authkey)
+    conn.send(("ready", os.getpid()))
+    try:
+        message = conn.recv()
+    except EOFError:
+        return 0
+    if message[0] != "run":
+        return 0
+    path = message[1]
+
+    # 작업 스크립트는 런처의 colorama 래핑 없이, 자기만의 __main__ 네임스페이스에서 실행
+    deinit()
+    show_own_console_window()
+    set_console_title(Path(path).name)
+    conn.send(("started", os.getpid()))
+    sys.argv = [path]
+    sys.path.insert(0, str(Path(path).resolve().parent))
+    exit_code = 0
+    try:
+        runpy.run_path(path, run_name="__main__")
+    except SystemExit as e:
+        if e.code is None:
+            exit_code = 0
+        elif isinstance(e.code, int):
+            exit_code = e.code
+        else:
+            print(e.code, file=sys.stderr)
+            exit_code = 1
+    except BaseException:
+        traceback.print_exc()
+        exit_code = 1
+    try:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        conn.send(("exit", exit_code))
+        conn.close()
+    except (OSError, ValueError):
+        pass
+    return exit_code
+
+
+class WarmRun:
+    """예열 워커에서 실행 중인 작업 (Popen처럼 pid, wait() 제공)"""
+
+    def __init__(self, conn, proc):
+        self.conn = conn
+        self.proc = proc
+        self.pid = proc.pid
+
+    def wait(self):
+        """작업 종료까지 기다려 종료 코드 반환"""
+        try:
+            kind, exit_code = self.conn.recv()
+            if kind == "exit":
+                return exit_code
+        except (EOFError, OSError, ValueError, TypeError):
+            pass
+        finally:
+            self.conn.close()
+        # 콘솔 창을 닫는 등 보고 없이 끝난 경우: 워커 프로세스 종료 코드
+        return self.proc.wait()
+
+
+class WarmWorkerPool:
+    """무거운 모듈을 미리 import한 Python 워커 풀. 워커는 작업 하나만 실행하고 새 워커로 교체됨"""
+
+    def __init__(self, script_path, size, imports):
+        from multiprocessing.connection import Listener
+
+        self.script_path = str(script_path)
+        self.size = size
+        self.imports = ",".join(imports)
+        self.authkey = os.urandom(16)
+        self.listener = Listener(authkey=self.authkey)
+        self._idle = queue.Queue()      # 준비 완료된 (conn, Popen)
+        self._procs = {}                # pid -> Popen (준비 중·대기 중 워커)
+        self._lock = threading.Lock()
+        self._closed = False
+        threading.Thread(target=self._accept_loop, daemon=True, name="warm-pool").start()
+        for _ in range(size):
+            self._spawn()
+
+    def _spawn(self):
+        env = dict(os.environ)
+        env[WORKER_ADDRESS_ENV] = str(self.listener.address)
+        env[WORKER_KEY_ENV] = self.authkey.hex()
+        env[WORKER_IMPORTS_ENV] = self.imports
+        kwargs = {}
+        if os.name == 'nt':
+            # 작업을 받기 전까지는 콘솔 창을 숨겨 둠
+            startupinfo = subprocess.STARTUPINFO()
+            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+            startupinfo.wShowWindow = 0  # SW_HIDE
+            kwargs = {"creationflags": subprocess.CREATE_NEW_CONSOLE, "startupinfo": startupinfo}
+        try:
+            proc = subprocess.Popen([sys.executable, "-u", self.script_path, "--warm-worker"], env=env, **kwargs)
+        except OSError:
+            return
+        with self._lock:
+            self._procs[proc.pid] = proc
+
+    def _accept_loop(self):
+        while not self._closed:
+            try:
+                conn = self.listener.accept()
+                kind, pid = conn.recv()
+            except Exception:
+                if self._closed:
+                    return
+                continue
+            with self._lock:
+                proc = self._procs.get(pid)
+            if kind == "ready" and proc is not None:
+                self._idle.put((conn, proc))
+            else:
+                conn.close()
+
+    def run(self, path):
+        """준비된 워커에 path 실행을 맡기고 WarmRun 반환. 준비된 워커가 없으면 None (일반 실행으로 대체)"""
+        while True:
+            try:
+                conn, proc = self._idle.get_nowait()
+            except queue.Empty:
+                return None
+            with self._lock:
+                self._procs.pop(proc.pid, None)
+            self._spawn()  # 다음 작업용 워커를 미리 예열
+            try:
+                conn.send(("run", path))
+                kind, _ = conn.recv()
+            except (EOFError, OSError):
+                conn.close()
+                continue  # 그 사이 죽은 워커: 다음 워커 시도
+            if kind == "started":
+                return WarmRun(conn, proc)
+            conn.close()
+
+    def close(self):
+        """대기 중인 워커 종료"""
+        self._closed = True
+        while True:
+            try:
+                conn, _ = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                conn.send(("quit", None))
+                conn.close()
+            except OSError:
+                pass
+        with self._lock:
+            for proc in self._procs.values():
+                if proc.poll() is None:
+                    proc.terminate()
+            self._procs.clear()
+        try:
+            self.listener.close()
+        except OSError:
+            pass
+
+
+def log_path_for(log_dir, filepath):
+    """작업 파일의 로그 경로: logs/<파일명>-<전체 경로 해시 8자리>.log (다른 폴더의 같은 이름 파일과 구분)"""
+    key = os.path.normcase(os.path.abspath(filepath)).encode("utf-8", "surrogatepass")
+    return Path(log_dir) / f"{Path(filepath).stem}-{hashlib.sha1(key).hexdigest()[:8]}.log"
+
+
+class RotatingLogFile:
+    """크기 제한 로그 파일. max_bytes를 넘으면 name.log -> name.log.1 -> ... 로 밀어내고 새로 씀.
+    같은 작업을 동시에 여러 번 실행하면 한 객체를 share()로 나눠 쓰고, 마지막 close()에서 파일을 닫음"""
+
+    def __init__(self, path, max_bytes, backups):
+        self.path = Path(path)
+        self.max_bytes = max(1024, max_bytes)
+        self.backups = max(0, backups)
+        self._lock = threading.Lock()
+        self._users = 1
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "ab")
+        self._size = self._file.tell()
+
+    def share(self):
+        """사용자 하나 추가. 이미 닫혔으면 False (새로 열어야 함)"""
+        with self._lock:
+            if self._file.closed:
+                return False
+            self._users += 1
+            return True
+
+    def _rotate(self):
+        self._file.close()
+        try:
+            if self.backups:
+                for i in range(self.backups - 1, 0, -1):
+                    older = self.path.with_name(f"{self.path.name}.{i}")
+                    if older.exists():
+                        os.replace(older, self.path.with_name(f"{self.path.name}.{i + 1}"))
+                os.replace(self.path, self.path.with_name(f"{self.path.name}.1"))
+            self._file = open(self.path, "wb")
+            self._size = 0
+        except OSError:
+            # 다른 프로그램이 파일을 열고 있어 밀어낼 수 없으면(Windows) 이번에는 이어서 씀
+            self._file = open(self.path, "ab")
+            self._size = self._file.tell()
+
+    def write_line(self, text):
+        data = (text + "\n").encode("utf-8")
+        with self._lock:
+            if self._file.closed:
+                return
+            if self._size and self._size + len(data) > self.max_bytes:
+                self._rotate()
+            self._file.write(data)
+            self._file.flush()
+            self._size += len(data)
+
+    def close(self):
+        with self._lock:
+            self._users -= 1
+            if self._users <= 0:
+                self._file.close()
+
+
+class CapturedRun:
+    """출력을 캡처하며 실행 중인 작업 (Popen처럼 pid, wait() 제공).
+    stdout/stderr를 각각 읽기 스레드가 받아 회전 로그와 최근 N줄 링 버퍼에 씀"""
+
+    def __init__(self, proc, log, tail_lines, updated):
+        self.proc = proc
+        self.pid = proc.pid
+        self.log = log
+        self.tail = deque(maxlen=max(1, tail_lines))
+        self.updated = updated
+        self.exit_code = None
+        self._readers = [
+            threading.Thread(target=self._pump, args=(proc.stdout, ""), daemon=True, name="capture-out"),
+            threading.Thread(target=self._pump, args=(proc.stderr, "[err] "), daemon=True, name="capture-err"),
+        ]
+        for reader in self._readers:
+            reader.start()
+
+    def _pump(self, stream, prefix):
+        with stream:
+            for raw in iter(lambda: stream.readline(CAPTURE_READ_LIMIT), b""):
+                line = prefix + raw.decode("utf-8", "replace").rstrip("\r\n")
+                try:
+                    self.log.write_line(line)
+                except (OSError, ValueError):
+                    # 로그 쓰기가 실패해도 파이프는 계속 비워야 작업이 출력에서 멈추지 않음
+                    pass
+                self.tail.append(line)
+                self.updated.set()
+
+    @property
+    def running(self):
+        return self.exit_code is None
+
+    def wait(self):
+        """작업 종료와 남은 출력 기록까지 기다려 종료 코드 반환"""
+        exit_code = self.proc.wait()
+        for reader in self._readers:
+            reader.join()
+        if self.exit_code is None:
+            self.exit_code = exit_code
+            # 로그 쓰기·닫기가 실패해도 종료 코드는 돌려줌 (_pump와 같은 처리)
+            try:
+                self.log.write_line(f"--- 종료 코드 {exit_code} ({datetime.now():%Y-%m-%d %H:%M:%S})")
+            except (OSError, ValueError):
+                pass
+            try:
+                self.log.close()
+            except OSError:
+                pass
+            self.updated.set()
+        return exit_code
+
+
 class TaskLauncher:
     def __init__(self):
         self.script_dir = Path(__file__).resolve().parent
         self.excel_path = self.script_dir / EXCEL_FILENAME
+        self.cache_path = self.script_dir / TASK_CACHE_FILENAME
         self.tasks = []
+        self.settings = load_settings(self.script_dir)
+        self.profiler = StartupProfiler() if "--profile-startup" in sys.argv else None
+        self._status_cache = {}     # 경로 -> (조회 시각, FileStatus)
+        self._status_pending = {}   # 경로 -> 조회 중인 Future
+        self._status_lock = threading.Lock()
+        self._status_pool = None
+        self.renderer = FrameRenderer()
+        self.line_reader = LineReader()
+        self.loaded_signature = None    # 현재 self.tasks를 읽어 온 엑셀 서명
+        self.watcher = None
+        self.reload_notice = ""
+        self._status_updated = threading.Event()
+        self.history = RunHistory(self.script_dir / RUN_HISTORY_FILENAME)
+        self.warm_pool = None
+        self._index = None
+        self.filter_query = ""
+        self.page = 0
+        self.scheduler = None
+        self.schedule_notice = ""
+        self._schedule_event = threading.Event()
+        self.outputs = {}           # 경로 -> 마지막 CapturedRun
+        self._logs = {}             # 로그 경로 -> RotatingLogFile (동시 실행끼리 공유)
+        self._logs_lock = threading.Lock()
+        self.resident = None
+        self._output_event = threading.Event()
+
+    def profile_phase(self, name):
+        """--profile-startup일 때만 단계 시간 측정"""
+        if self.profiler is None:
+            return nullcontext()
+        return self.profiler.phase(name)
 
     def get_excel_path(self):
         """엑셀 설정 파일 전체 경로"""
         return str(self.excel_path)
 
     def ensure_excel_template(self):
-        """엑셀 파일이 없으면 헤더만 있는 템플릿 생성"""
+        """엑셀 파일이 없으면 헤더만 있는 템플릿 생성. 알림 메시지 줄 목록 반환 (스피너 안에서도 부르므로 직접 출력하지 않음)"""
+        messages = []
         if not self.excel_path.exists():
-            print(f"\n{Fore.LIGHTYELLOW_EX}{ICONS['warning']} 설정 파일이 없습니다. 템플릿을 생성합니다...{Style.RESET_ALL}")
+            messages.append(f"\n{Fore.LIGHTYELLOW_EX}{ICONS['warning']} 설정 파일이 없습니다. 템플릿을 생성했습니다.{Style.RESET_ALL}")
 
-            wb = Workbook()
+            wb = import_openpyxl().Workbook()
             ws = wb.active
             ws.title = "작업목록"
             for col, header in enumerate(EXCEL_HEADERS, 1):
@@ -156,22 +1388,24 @@ class TaskLauncher:
             ws.cell(row=2, column=2, value="예시: Python 스크립트")
             ws.cell(row=2, column=3, value="Python 파일 실행 예시")
             ws.cell(row=2, column=4, value="C:\\경로\\스크립트.py")
+            ws.cell(row=2, column=5, value="아침")
+            ws.cell(row=2, column=6, value="평일 09:00")
+            ws.cell(row=2, column=7, value="")
             ws.cell(row=3, column=1, value=2)
             ws.cell(row=3, column=2, value="예시: 엑셀 파일")
             ws.cell(row=3, column=3, value="엑셀 문서 열기 예시")
             ws.cell(row=3, column=4, value="C:\\경로\\문서.xlsx")
             wb.save(self.get_excel_path())
 
-            self.print_loading_animation("템플릿 생성", 0.5)
-            print(f"{Fore.GREEN}{ICONS['success']} 설정 파일을 생성했습니다!{Style.RESET_ALL}")
-            print(f"{Fore.LIGHTGREEN_EX}  ▸ {self.excel_path}{Style.RESET_ALL}\n")
-            time.sleep(0.5)
+            messages.append(f"{Fore.LIGHTGREEN_EX}  ▸ {self.excel_path}{Style.RESET_ALL}\n")
+        return messages
 
     def open_excel_for_edit(self):
         """엑셀 파일을 기본 프로그램으로 열기"""
         path = self.get_excel_path()
         if not os.path.exists(path):
-            self.ensure_excel_template()
+            for line in self.ensure_excel_template():
+                print(line)
             path = self.get_excel_path()
         try:
             if os.name == 'nt':
@@ -182,64 +1416,245 @@ class TaskLauncher:
             print(f"\n{Fore.RED}{ICONS['error']} 엑셀 파일 열기 오류{Style.RESET_ALL}")
             print(f"{Fore.LIGHTRED_EX}  ▸ {str(e)}{Style.RESET_ALL}\n")
 
-    def load_tasks_from_excel(self):
-        """엑셀 파일에서 작업 목록 읽기 (제목, 설명, 파일경로)"""
-        self.tasks = []
-        path = self.get_excel_path()
-        if not os.path.exists(path):
-            return
+    def get_excel_signature(self):
+        """엑셀 파일의 (크기, 수정시각 ns). 없으면 None"""
+        try:
+            st = os.stat(self.get_excel_path())
+        except OSError:
+            return None
+        return (st.st_size, st.st_mtime_ns)
+
+    def read_task_cache(self, signature):
+        """캐시의 서명이 엑셀과 같으면 작업 목록 반환, 아니면 None"""
+        try:
+            with open(self.cache_path, "rb") as f:
+                version, size, mtime_ns, tasks = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if version != TASK_CACHE_VERSION or (size, mtime_ns) != signature:
+            return None
+        return tasks
+
+    def write_task_cache(self, signature, tasks):
+        """작업 목록 캐시 저장 (임시 파일에 쓴 뒤 교체)"""
+        tmp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                marshal.dump((TASK_CACHE_VERSION, signature[0], signature[1], tasks), f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            pass
+
+    def parse_tasks_from_workbook(self):
+        """openpyxl로 엑셀을 열어 작업 목록 파싱 (제목, 설명, 파일경로, 그룹, 일정, 선행작업)"""
+        tasks = []
+        wb = import_openpyxl().load_workbook(self.get_excel_path(), read_only=True, data_only=True)
         try:
-            wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
             ws = wb.active
-            for row_idx, row in enumerate(ws.iter_rows(min_row=2, values_only=True), start=2):
+            for row in ws.iter_rows(min_row=2, values_only=True):
                 if not row or len(row) < 4:
                     continue
                 _, name, desc, path_val = (row[0], row[1], row[2], row[3])
-                name = (name or "").strip()
-                desc = (desc or "").strip()
-                path_val = (path_val or "").strip()
-                path_val = self.clean_path(path_val)
+                group = row[4] if len(row) > 4 else None
+                schedule = row[5] if len(row) > 5 else None
+                depends = row[6] if len(row) > 6 else None
+                name = str(name or "").strip()
+                desc = str(desc or "").strip()
+                path_val = self.clean_path(str(path_val or ""))
                 if not path_val:
                     continue
-                self.tasks.append({
+                tasks.append({
                     "name": name or "제목 없음",
                     "desc": desc or "",
-                    "path": path_val
+                    "path": path_val,
+                    "group": str(group or "").strip(),
+                    "schedule": str(schedule or "").strip(),
+                    "depends": str(depends or "").strip()
                 })
+        finally:
             wb.close()
+        return tasks
+
+    def load_tasks_from_excel(self):
+        """작업 목록 읽기: 엑셀이 바뀌지 않았으면 캐시, 바뀌었으면 엑셀을 파싱해 캐시 갱신.
+        오류 메시지 줄 목록 반환 (스피너 안에서 부르므로 직접 출력하지 않음)"""
+        self.tasks = []
+        signature = self.get_excel_signature()
+        if signature is None:
+            self.loaded_signature = None
+            return []
+        cached = self.read_task_cache(signature)
+        if cached is not None:
+            self.tasks = cached
+            self.loaded_signature = signature
+            return []
+        try:
+            self.tasks = self.parse_tasks_from_workbook()
         except Exception as e:
-            print(f"\n{Fore.RED}{ICONS['error']} 엑셀 읽기 오류{Style.RESET_ALL}")
-            print(f"{Fore.LIGHTRED_EX}  ▸ {str(e)}{Style.RESET_ALL}\n")
+            return [f"\n{Fore.RED}{ICONS['error']} 엑셀 읽기 오류{Style.RESET_ALL}",
+                    f"{Fore.LIGHTRED_EX}  ▸ {str(e)}{Style.RESET_ALL}\n"]
+        self.write_task_cache(signature, self.tasks)
+        self.loaded_signature = signature
+        return []
+
+    def apply_reloaded_tasks(self, signature, new_tasks):
+        """백그라운드에서 다시 읽은 목록 반영. 바뀐 작업만 골라 내고, 남은 경로의 상태 캐시는 유지"""
+        def key(task):
+            return (task.get('name', ''), task.get('desc', ''), task.get('path', ''),
+                    task.get('schedule', ''), task.get('depends', ''))
+
+        old_keys = {key(t) for t in self.tasks}
+        new_keys = {key(t) for t in new_tasks}
+        added = len(new_keys - old_keys)
+        removed = len(old_keys - new_keys)
+        kept = len(new_keys & old_keys)
+
+        # 목록에서 빠진 경로의 상태만 버림 (나머지는 다시 stat 하지 않음)
+        live_paths = {t.get('path', '') for t in new_tasks}
+        with self._status_lock:
+            for path in [p for p in self._status_cache if p not in live_paths]:
+                del self._status_cache[path]
+
+        self.tasks = new_tasks
+        self.loaded_signature = signature
+        self.reload_notice = f"엑셀 변경 자동 반영: 추가 {added} · 삭제 {removed} · 유지 {kept}"
+        if self.scheduler is not None:
+            self.scheduler.set_tasks(self.tasks)
+
+    def poll_background(self):
+        """입력 대기 중 호출: 엑셀 재로딩 결과나 늦게 끝난 파일 상태가 있으면 메뉴를 제자리에서 다시 그림"""
+        redraw = False
+        if self.resident is not None and self.resident.show_requested.is_set():
+            # 이미 보이는 상태에서 다시 실행: 창만 앞으로
+            self.resident.show_requested.clear()
+            show_own_console_window()
+        if self.watcher is not None:
+            pending = self.watcher.take_pending()
+            if pending is not None:
+                self.apply_reloaded_tasks(*pending)
+                redraw = True
+        if self._status_updated.is_set() or self.history.updated.is_set():
+            redraw = True
+        if self._schedule_event.is_set():
+            self._schedule_event.clear()
+            redraw = True
+        if self._output_event.is_set():
+            self._output_event.clear()
+            redraw = True
+        if redraw:
+            self.display_main_menu()
+        return redraw
+
+    def toggle_scheduler(self):
+        """스케줄러 모드 켜기/끄기 (켜져 있는 동안 일정이 된 작업을 메뉴와 함께 실행)"""
+        if self.scheduler is None:
+            self.scheduler = TaskScheduler(self.run_scheduled_task)
+            self.scheduler.set_tasks(self.tasks)
+            self.scheduler.start()
+            self.schedule_notice = "스케줄러를 켰습니다"
+        else:
+            self.scheduler.stop()
+            self.scheduler = None
+            self.schedule_notice = ""
+
+    def run_scheduled_task(self, task, due):
+        """스케줄러 스레드에서 호출: 일반 실행과 같은 경로로 작업 실행"""
+        name = task.get('name', '제목 없음')
+        path = task.get('path', '')
+        when = datetime.fromtimestamp(due).strftime('%H:%M')
+        if not os.path.exists(path):
+            self.schedule_notice = f"{when} {name}: 파일 없음"
+        else:
+            try:
+                self.start_task(path, name)
+                self.schedule_notice = f"{when} {name} 실행"
+            except Exception as e:
+                self.schedule_notice = f"{when} {name}: 실행 오류 ({e})"
+        self._schedule_event.set()
+
+    def get_scheduler_line(self):
+        """하단 스케줄러 상태 줄 (꺼져 있으면 빈 문자열)"""
+        if self.scheduler is None:
+            return ""
+        parts = [f"{ICONS['alarm']} 스케줄러 켜짐"]
+        next_run = self.scheduler.next_run()
+        if next_run is not None:
+            due, task = next_run
+            parts.append(f"다음: {datetime.fromtimestamp(due).strftime('%m-%d %H:%M')} {task.get('name', '')}")
+        else:
+            parts.append("일정 있는 작업 없음")
+        if self.schedule_notice:
+            parts.append(f"최근: {self.schedule_notice}")
+        return " · ".join(parts)
 
     def clear_screen(self):
-        """화면 클리어"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        """화면 클리어 (셸 실행 없이 ANSI 시퀀스)"""
+        sys.stdout.write(ANSI_CLEAR_SCREEN)
+        sys.stdout.flush()
+        self.renderer.invalidate()
+
+    def _probe_and_store(self, filepath):
+        """상태 조회 후 캐시에 저장 (스레드 풀에서 실행)"""
+        status = probe_file_status(filepath)
+        with self._status_lock:
+            self._status_cache[filepath] = (time.monotonic(), status)
+            self._status_pending.pop(filepath, None)
+        self._status_updated.set()
+        return status
+
+    def prefetch_file_statuses(self, paths, timeout=STATUS_WAIT):
+        """캐시가 만료된 경로들을 스레드 풀로 동시에 stat (최대 timeout초만 대기)"""
+        now = time.monotonic()
+        futures = []
+        with self._status_lock:
+            for path in paths:
+                cached = self._status_cache.get(path)
+                if cached is not None and now - cached[0] < STATUS_TTL:
+                    continue
+                future = self._status_pending.get(path)
+                if future is None:
+                    if self._status_pool is None:
+                        self._status_pool = ThreadPoolExecutor(max_workers=STATUS_WORKERS,
+                                                               thread_name_prefix="file-status")
+                    future = self._status_pool.submit(self._probe_and_store, path)
+                    self._status_pending[path] = future
+                futures.append(future)
+        if futures:
+            # 느린 네트워크/클라우드 경로는 기다리지 않고 다음 화면에서 반영
+            wait_futures(futures, timeout=timeout)
+
+    def get_file_status(self, filepath):
+        """파일 상태 (캐시 우선). 느린 경로를 아직 조회 중이면 이전 값 또는 None"""
+        with self._status_lock:
+            cached = self._status_cache.get(filepath)
+            if cached is not None and time.monotonic() - cached[0] < STATUS_TTL:
+                return cached[1]
+            if filepath in self._status_pending:
+                return cached[1] if cached is not None else None
+        return self._probe_and_store(filepath)
 
     def get_file_modified_time(self, filepath):
         """파일의 최종 수정 시간 가져오기"""
-        try:
-            if os.path.exists(filepath):
-                timestamp = os.path.getmtime(filepath)
-                return datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M')
-            return "파일 없음"
-        except Exception:
+        status = self.get_file_status(filepath)
+        if status is None:
             return "알 수 없음"
+        if not status.exists:
+            return "파일 없음"
+        return datetime.fromtimestamp(status.mtime).strftime('%Y-%m-%d %H:%M')
 
     def get_days_since_modified(self, filepath):
         """마지막 수정일로부터 경과한 일수 (오늘 0시 기준). 없으면 None"""
-        try:
-            if not os.path.exists(filepath):
-                return None
-            mtime = os.path.getmtime(filepath)
-            modified_date = datetime.fromtimestamp(mtime).date()
-            today = datetime.now().date()
-            return (today - modified_date).days
-        except Exception:
+        status = self.get_file_status(filepath)
+        if status is None or not status.exists:
             return None
+        modified_date = datetime.fromtimestamp(status.mtime).date()
+        today = datetime.now().date()
+        return (today - modified_date).days
 
     def file_exists(self, filepath):
         """파일 존재 여부 확인"""
-        return os.path.exists(filepath)
+        status = self.get_file_status(filepath)
+        return status is not None and status.exists
 
     def _box_line(self, text, color=Fore.CYAN):
         """박스 안 한 줄 (좌우 여백, 폭 맞춤)"""
@@ -250,7 +1665,7 @@ class TaskLauncher:
 
     def _visible_len(self, text):
         """ANSI 이스케이프 제외한 표시 길이"""
-        return len(re.sub(r"\033\[[0-9;]*m", "", text))
+        return len(ANSI_COLOR_RE.sub("", text))
 
     def _card_line(self, text):
         """작업 카드 내 한 줄 (박스 폭에 맞춤, ANSI 고려)"""
@@ -260,32 +1675,35 @@ class TaskLauncher:
         return f"  {text}{' ' * pad}  "
 
     def _center_in_box(self, text, width=UI_WIDTH - 2):
-        """박스 안 중앙 정렬 텍스트 (문자 수 기준)"""
+        """박스 안 중앙 정렬 텍스트 (문자 수 기준, ANSI 색상 코드는 길이에서 제외)"""
         t = text.strip()
-        pad = width - len(t)
+        pad = width - self._visible_len(t)
         if pad <= 0:
-            return t[:width]
+            # 색상 코드가 있으면 자르지 않음 (코드 중간을 자르면 뒤쪽 항목이 사라지거나 색이 깨짐)
+            return t if ANSI_COLOR_RE.search(t) else t[:width]
         return " " * (pad // 2) + t + " " * (pad - pad // 2)
 
-    def print_animated_header(self):
-        """화려한 애니메이션 헤더 출력"""
-        colors = [Fore.CYAN, Fore.LIGHTCYAN_EX, Fore.LIGHTBLUE_EX, Fore.CYAN]
+    def build_header_lines(self):
+        """화려한 헤더 (화면 버퍼용 줄 목록)"""
+        lines = [""]
 
         # 상단 테두리 (그라디언트 효과)
-        print(f"\n{Fore.CYAN}{Style.BRIGHT}╔{'═' * (UI_WIDTH - 2)}╗{Style.RESET_ALL}")
+        lines.append(f"{Fore.CYAN}{Style.BRIGHT}╔{'═' * (UI_WIDTH - 2)}╗{Style.RESET_ALL}")
 
         # 제목 라인
         title = f"{ICONS['rocket']}  JP 통합업무 대시보드  {ICONS['star']}"
         centered = self._center_in_box(title, UI_WIDTH - 2)
-        print(f"{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}{Back.BLUE}{Fore.WHITE}{Style.BRIGHT}{centered}{Style.RESET_ALL}{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}")
+        lines.append(f"{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}{Back.BLUE}{Fore.WHITE}{Style.BRIGHT}{centered}{Style.RESET_ALL}{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}")
 
         # 부제목
         subtitle = "✨ Task Launcher & Workspace Manager ✨"
         centered_sub = self._center_in_box(subtitle, UI_WIDTH - 2)
-        print(f"{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}{Back.BLUE}{Fore.LIGHTYELLOW_EX}{centered_sub}{Style.RESET_ALL}{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}")
+        lines.append(f"{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}{Back.BLUE}{Fore.LIGHTYELLOW_EX}{centered_sub}{Style.RESET_ALL}{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}")
 
         # 구분선
-        print(f"{Fore.CYAN}{Style.BRIGHT}╠{'═' * (UI_WIDTH - 2)}╣{Style.RESET_ALL}\n")
+        lines.append(f"{Fore.CYAN}{Style.BRIGHT}╠{'═' * (UI_WIDTH - 2)}╣{Style.RESET_ALL}")
+        lines.append("")
+        return lines
 
     def get_file_icon(self, filepath):
         """파일 확장자에 따른 아이콘 반환"""
@@ -294,13 +1712,15 @@ class TaskLauncher:
             return ICONS['python']
         elif ext in ['.xlsx', '.xls', '.csv']:
             return ICONS['excel']
-        elif os.path.isdir(filepath):
+        elif self.file_exists(filepath) and self.get_file_status(filepath).is_dir:
             return ICONS['folder']
         else:
             return ICONS['file']
 
-    def get_status_badge(self, days):
-        """경과 일수에 따른 상태 배지"""
+    def get_status_badge(self, days, checking=False):
+        """경과 일수에 따른 상태 배지 (checking: 느린 드라이브 조회 중)"""
+        if checking:
+            return f"{Fore.LIGHTBLACK_EX}{ICONS['hourglass']} 확인 중{Style.RESET_ALL}"
         if days is None:
             return f"{Fore.RED}{ICONS['error']} 파일 없음{Style.RESET_ALL}"
         elif days == 0:
@@ -313,78 +1733,224 @@ class TaskLauncher:
             return f"{Fore.LIGHTBLACK_EX}{ICONS['clock']} {days}일 전{Style.RESET_ALL}"
 
     def display_main_menu(self):
-        """메인 화면 출력 (박스형 대시보드) - 개선된 버전"""
-        self.clear_screen()
+        """메인 화면 출력 (박스형 대시보드): 한 화면을 버퍼에 모아 바뀐 줄만 다시 그림"""
+        self.renderer.render(self.build_main_menu_lines())
+
+    def get_run_badge(self, path):
+        """실행 기록 배지: 실행 시간 p50/p95와 마지막 결과 (기록 없으면 빈 문자열)"""
+        stats = self.history.get_stats(path)
+        if stats is None:
+            return ""
+        parts = []
+        if stats.p50 is not None:
+            parts.append(f"p50 {format_duration(stats.p50)} · p95 {format_duration(stats.p95)}")
+        if stats.last_exit_code is None:
+            parts.append(f"{Fore.LIGHTBLACK_EX}마지막: 열림")
+        elif stats.last_exit_code == 0:
+            parts.append(f"{Fore.GREEN}마지막: 성공")
+        else:
+            parts.append(f"{Fore.RED}마지막: 코드 {stats.last_exit_code}")
+        return f"  {Fore.LIGHTBLACK_EX}{ICONS['clock']} " + f"{Fore.LIGHTBLACK_EX} · ".join(parts) + Style.RESET_ALL
+
+    def get_task_index(self):
+        """작업 목록 검색 인덱스 (목록이 바뀌면 다시 만듦)"""
+        if self._index is None or self._index.tasks is not self.tasks:
+            self._index = TaskIndex(self.tasks)
+        return self._index
+
+    def get_visible_indices(self):
+        """필터를 적용한 작업 인덱스 목록"""
+        if not self.filter_query:
+            return list(range(len(self.tasks)))
+        return self.get_task_index().search(self.filter_query)
+
+    def get_page_layout(self):
+        """
+        (한 페이지 작업 수, 한 줄 행으로 보일지). settings.json의 page_size, 0이면 콘솔 높이에 맞춤.
+        카드가 PAGE_SIZE_MIN장도 안 들어가거나 지정한 수가 화면을 넘으면 한 줄 행으로 바꿈.
+        """
+        try:
+            size = int(self.settings.get("page_size") or 0)
+        except (TypeError, ValueError):
+            size = 0
+        room = shutil.get_terminal_size().lines - MENU_CHROME_LINES
+        if size > 0:
+            return size, size * TASK_CARD_LINES - 1 > room
+        cards = (room + 1) // TASK_CARD_LINES
+        if cards >= PAGE_SIZE_MIN:
+            return cards, False
+        return max(1, room), True
+
+    def set_filter(self, query):
+        """검색 필터 변경 (첫 페이지로)"""
+        self.filter_query = query.strip()
+        self.page = 0
+
+    def on_input_change(self, buf):
+        """입력 중 '/검색어'면 타이핑하는 대로 목록을 걸러 제자리에서 다시 그림"""
+        if not buf.startswith("/"):
+            return False
+        query = buf[1:]
+        if query.strip() == self.filter_query:
+            return False
+        self.set_filter(query)
+        self.display_main_menu()
+        return True
 
+    def build_task_card_lines(self, idx, task):
+        """작업 카드 한 장 (번호·제목, 설명, 경로, 상태)"""
+        lines = []
+        name = task.get('name', '제목 없음')
+        desc = task.get('desc', '') or '설명 없음'
+        path = task.get('path', '')
+
+        # 파일 아이콘
+        file_icon = self.get_file_icon(path)
+
+        status = self.get_file_status(path)
+        if status is None:
+            status_badge = self.get_status_badge(None, checking=True)
+            name_color = Fore.WHITE
+            number_color = Fore.LIGHTYELLOW_EX
+        elif status.exists:
+            days = self.get_days_since_modified(path)
+            status_badge = self.get_status_badge(days)
+            name_color = Fore.WHITE
+            number_color = Fore.LIGHTYELLOW_EX
+        else:
+            status_badge = self.get_status_badge(None)
+            name_color = Fore.LIGHTBLACK_EX
+            number_color = Fore.LIGHTBLACK_EX
+
+        # 작업 카드 (더 화려하게)
+        # 번호와 제목
+        line1 = f"{number_color}{Style.BRIGHT}【{idx}】{Style.RESET_ALL} {file_icon} {name_color}{Style.BRIGHT}{name}{Style.RESET_ALL}"
+        lines.append(f"{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}{self._card_line(line1)}{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}")
+
+        # 설명
+        line2 = f"     {Fore.LIGHTBLUE_EX}▸ {desc}{Style.RESET_ALL}"
+        if task.get('schedule'):
+            try:
+                parse_schedule(task['schedule'])
+                line2 += f"  {Fore.LIGHTMAGENTA_EX}{ICONS['alarm']} {task['schedule']}{Style.RESET_ALL}"
+            except ValueError:
+                line2 += f"  {Fore.RED}{ICONS['warning']} 일정 인식 불가{Style.RESET_ALL}"
+        if task.get('depends'):
+            line2 += f"  {Fore.LIGHTBLACK_EX}{ICONS['chain']} {task['depends']}{Style.RESET_ALL}"
+        lines.append(f"{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}{self._card_line(line2)}{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}")
+
+        # 경로
+        path_short = path if len(path) <= UI_WIDTH - 18 else path[: UI_WIDTH - 21] + "..."
+        line3 = f"     {Fore.LIGHTBLACK_EX}📂 {path_short}{Style.RESET_ALL}"
+        lines.append(f"{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}{self._card_line(line3)}{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}")
+
+        # 상태
+        line4 = f"     {status_badge}{self.get_run_badge(path)}"
+        output = self.outputs.get(path)
+        if output is not None and output.tail:
+            room = UI_WIDTH - 12 - self._visible_len(line4)
+            if room > 8:
+                last = ANSI_COLOR_RE.sub("", output.tail[-1]).replace("\t", " ")
+                line4 += f"  {Fore.LIGHTBLACK_EX}{ICONS['log']} {fit_display(last, room - 3).rstrip()}{Style.RESET_ALL}"
+        lines.append(f"{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}{self._card_line(line4)}{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}")
+        return lines
+
+    def build_task_row_line(self, idx, task):
+        """작업 한 줄 (번호·제목·상태, 좁은 콘솔용)"""
+        name = task.get('name', '제목 없음')
+        path = task.get('path', '')
+        status = self.get_file_status(path)
+        if status is None:
+            status_badge = self.get_status_badge(None, checking=True)
+            name_color = Fore.WHITE
+        elif status.exists:
+            status_badge = self.get_status_badge(self.get_days_since_modified(path))
+            name_color = Fore.WHITE
+        else:
+            status_badge = self.get_status_badge(None)
+            name_color = Fore.LIGHTBLACK_EX
+        badges = f"{status_badge}{self.get_run_badge(path)}"
+        head = f"{Fore.LIGHTYELLOW_EX}{Style.BRIGHT}【{idx}】{Style.RESET_ALL} {self.get_file_icon(path)} "
+        room = UI_WIDTH - 8 - self._visible_len(head) - self._visible_len(badges)
+        line = f"{head}{name_color}{Style.BRIGHT}{name[:max(room, 4)].ljust(max(room, 4))}{Style.RESET_ALL}  {badges}"
+        return f"{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}{self._card_line(line)}{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}"
+
+    def build_main_menu_lines(self):
+        """메인 화면 전체를 줄 목록으로 생성 (필터·현재 페이지의 작업만)"""
         # 화려한 헤더
-        self.print_animated_header()
+        lines = self.build_header_lines()
+
+        visible = self.get_visible_indices()
+        page_size, compact = self.get_page_layout()
+        page_count = max(1, -(-len(visible) // page_size))
+        self.page = min(max(0, self.page), page_count - 1)
+        page_indices = visible[self.page * page_size:(self.page + 1) * page_size]
 
         # 메뉴 리스트
         if not self.tasks:
             # 작업이 없을 때
-            print(f"{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}{'  ' * (UI_WIDTH // 2 - 1)}{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}")
+            lines.append(f"{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}{'  ' * (UI_WIDTH // 2 - 1)}{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}")
             msg = f"{ICONS['warning']} 등록된 작업이 없습니다"
-            print(f"{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}{self._center_in_box(msg, UI_WIDTH - 2)}{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}")
+            lines.append(f"{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}{self._center_in_box(msg, UI_WIDTH - 2)}{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}")
             hint = "[E]를 눌러 엑셀에서 작업을 추가하세요"
-            print(f"{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}{Fore.YELLOW}{self._center_in_box(hint, UI_WIDTH - 2)}{Style.RESET_ALL}{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}")
-            print(f"{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}{'  ' * (UI_WIDTH // 2 - 1)}{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}")
+            lines.append(f"{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}{Fore.YELLOW}{self._center_in_box(hint, UI_WIDTH - 2)}{Style.RESET_ALL}{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}")
+            lines.append(f"{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}{'  ' * (UI_WIDTH // 2 - 1)}{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}")
+        elif not page_indices:
+            # 검색 결과가 없을 때
+            msg = f"{ICONS['warning']} '{self.filter_query}'에 맞는 작업이 없습니다"
+            lines.append(f"{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}{self._center_in_box(msg, UI_WIDTH - 2)}{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}")
         else:
-            # 작업 목록 표시
-            for idx, task in enumerate(self.tasks, 1):
-                name = task.get('name', '제목 없음')
-                desc = task.get('desc', '') or '설명 없음'
-                path = task.get('path', '')
-
-                # 파일 아이콘
-                file_icon = self.get_file_icon(path)
-
-                if self.file_exists(path):
-                    mod_time = self.get_file_modified_time(path)
-                    days = self.get_days_since_modified(path)
-                    status_badge = self.get_status_badge(days)
-                    name_color = Fore.WHITE
-                    number_color = Fore.LIGHTYELLOW_EX
-                else:
-                    status_badge = self.get_status_badge(None)
-                    name_color = Fore.LIGHTBLACK_EX
-                    number_color = Fore.LIGHTBLACK_EX
-
-                # 작업 카드 (더 화려하게)
-                # 번호와 제목
-                line1 = f"{number_color}{Style.BRIGHT}【{idx}】{Style.RESET_ALL} {file_icon} {name_color}{Style.BRIGHT}{name}{Style.RESET_ALL}"
-                print(f"{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}{self._card_line(line1)}{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}")
-
-                # 설명
-                line2 = f"     {Fore.LIGHTBLUE_EX}▸ {desc}{Style.RESET_ALL}"
-                print(f"{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}{self._card_line(line2)}{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}")
-
-                # 경로
-                path_short = path if len(path) <= UI_WIDTH - 18 else path[: UI_WIDTH - 21] + "..."
-                line3 = f"     {Fore.LIGHTBLACK_EX}📂 {path_short}{Style.RESET_ALL}"
-                print(f"{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}{self._card_line(line3)}{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}")
-
-                # 상태
-                line4 = f"     {status_badge}"
-                print(f"{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}{self._card_line(line4)}{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}")
+            # 현재 페이지 작업만 표시 (파일 상태는 한꺼번에 동시 조회)
+            # 신호는 조회 전에 지움: 대기 시간이 지나 늦게 끝난 조회의 신호가 지워지지 않도록
+            self._status_updated.clear()
+            self.history.updated.clear()
+            self.prefetch_file_statuses([self.tasks[i].get('path', '') for i in page_indices])
+            for pos, task_idx in enumerate(page_indices):
+                if compact:
+                    lines.append(self.build_task_row_line(task_idx + 1, self.tasks[task_idx]))
+                    continue
+                lines.extend(self.build_task_card_lines(task_idx + 1, self.tasks[task_idx]))
 
                 # 구분선
-                if idx < len(self.tasks):
+                if pos < len(page_indices) - 1:
                     separator = "─" * (UI_WIDTH - 6)
-                    print(f"{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}   {Fore.LIGHTBLACK_EX}{separator}{Style.RESET_ALL}   {Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}")
+                    lines.append(f"{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}   {Fore.LIGHTBLACK_EX}{separator}{Style.RESET_ALL}   {Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}")
 
         # 하단 컨트롤 메뉴
-        print(f"{Fore.CYAN}{Style.BRIGHT}╠{'═' * (UI_WIDTH - 2)}╣{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}{' ' * (UI_WIDTH - 2)}{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}")
+        lines.append(f"{Fore.CYAN}{Style.BRIGHT}╠{'═' * (UI_WIDTH - 2)}╣{Style.RESET_ALL}")
+        lines.append(f"{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}{' ' * (UI_WIDTH - 2)}{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}")
 
         menu_parts = [
             f"{Fore.LIGHTYELLOW_EX}{Style.BRIGHT}[번호]{Style.RESET_ALL} {ICONS['rocket']} 실행",
             f"{Fore.LIGHTGREEN_EX}{Style.BRIGHT}[E]{Style.RESET_ALL} {ICONS['excel']} 엑셀편집",
+            f"{Fore.LIGHTMAGENTA_EX}{Style.BRIGHT}[S]{Style.RESET_ALL} {ICONS['alarm']} 스케줄러",
             f"{Fore.LIGHTRED_EX}{Style.BRIGHT}[Q]{Style.RESET_ALL} {ICONS['target']} 종료"
         ]
+        if self.resident is not None:
+            # 상주 모드의 Q는 창만 숨김
+            menu_parts[-1] = (f"{Fore.LIGHTRED_EX}{Style.BRIGHT}[Q]{Style.RESET_ALL} {ICONS['hourglass']} 숨기기"
+                              f"  {Fore.LIGHTRED_EX}{Style.BRIGHT}[Q!]{Style.RESET_ALL} {ICONS['target']} 종료")
         menu_text = "  │  ".join(menu_parts)
-        print(f"{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}{self._center_in_box(menu_text, UI_WIDTH - 2)}{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}{' ' * (UI_WIDTH - 2)}{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}{Style.BRIGHT}╚{'═' * (UI_WIDTH - 2)}╝{Style.RESET_ALL}\n")
+        lines.append(f"{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}{self._center_in_box(menu_text, UI_WIDTH - 2)}{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}")
+        multi_hint = (f"{Fore.LIGHTBLACK_EX}여러 개 동시 실행: 1,3,5-8 또는 @그룹 (동시 최대 {self.get_max_parallel()}개)"
+                      f"  ·  선행작업까지 파이프라인: P번호{Style.RESET_ALL}")
+        lines.append(f"{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}{self._card_line(multi_hint)}{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}")
+        page_info = f"페이지 {self.page + 1}/{page_count} · {len(visible)}/{len(self.tasks)}개"
+        if self.filter_query:
+            page_info += f" · 검색: {self.filter_query}"
+        page_hint = f"{Fore.LIGHTBLACK_EX}{page_info}   [<][>] 페이지  [/검색어] 찾기  [/] 검색 해제{Style.RESET_ALL}"
+        lines.append(f"{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}{self._card_line(page_hint)}{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}")
+        scheduler_line = self.get_scheduler_line()
+        if scheduler_line:
+            scheduler_line = f"{Fore.LIGHTMAGENTA_EX}{scheduler_line}{Style.RESET_ALL}"
+            lines.append(f"{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}{self._card_line(scheduler_line)}{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}")
+        if self.reload_notice:
+            notice = f"{Fore.LIGHTGREEN_EX}{ICONS['reload']} {self.reload_notice}{Style.RESET_ALL}"
+            lines.append(f"{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}{self._card_line(notice)}{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}")
+        lines.append(f"{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}{' ' * (UI_WIDTH - 2)}{Fore.CYAN}{Style.BRIGHT}║{Style.RESET_ALL}")
+        lines.append(f"{Fore.CYAN}{Style.BRIGHT}╚{'═' * (UI_WIDTH - 2)}╝{Style.RESET_ALL}")
+        lines.append("")
+        return lines
 
     def clean_path(self, path_str):
         """파일 경로에서 따옴표 등 제거"""
@@ -399,21 +1965,12 @@ class TaskLauncher:
             path_str = path_str[1:-1]
         return path_str.strip()
 
-    def print_loading_animation(self, message="처리 중", duration=1.0):
-        """로딩 애니메이션"""
-        frames = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
-        end_time = time.time() + duration
-        i = 0
-        while time.time() < end_time:
-            frame = frames[i % len(frames)]
-            print(f"\r{Fore.CYAN}{frame} {message}...{Style.RESET_ALL}", end="", flush=True)
-            time.sleep(0.1)
-            i += 1
-        print(f"\r{' ' * (len(message) + 10)}\r", end="")
-
     def edit_excel_and_reload(self):
-        """엑셀 파일을 열고, 저장 후 Enter 시 목록 다시 읽기"""
+        """엑셀 파일을 열기. 변경 감시 중이면 저장하는 즉시 메뉴에 자동 반영, 아니면 Enter 후 다시 읽기"""
         self.open_excel_for_edit()
+        if self.watcher is not None and self.line_reader.interactive:
+            self.reload_notice = "엑셀 편집 중: 저장하면 자동으로 반영됩니다"
+            return
         print(f"\n{Fore.LIGHTCYAN_EX}{'═' * 60}{Style.RESET_ALL}")
         print(f"{Fore.CYAN}{ICONS['excel']} 엑셀에서 작업 목록을 편집하세요{Style.RESET_ALL}")
         print(f"{Fore.LIGHTBLACK_EX}  1. 작업 추가/수정/삭제{Style.RESET_ALL}")
@@ -422,15 +1979,254 @@ class TaskLauncher:
         print(f"{Fore.LIGHTCYAN_EX}{'═' * 60}{Style.RESET_ALL}\n")
         input(f"{Fore.LIGHTYELLOW_EX}▸ 작업 완료 후 Enter를 누르세요...{Style.RESET_ALL}")
 
-        self.print_loading_animation("작업 목록 로딩", 0.8)
-        self.load_tasks_from_excel()
+        with Spinner("작업 목록 로딩"):
+            messages = self.load_tasks_from_excel()
+        for line in messages:
+            print(line)
+        if self.scheduler is not None:
+            self.scheduler.set_tasks(self.tasks)
 
         print(f"\n{Fore.GREEN}{ICONS['success']} 작업 목록을 업데이트했습니다!{Style.RESET_ALL}")
         print(f"{Fore.LIGHTGREEN_EX}  ▸ 총 {len(self.tasks)}개의 작업이 등록되어 있습니다{Style.RESET_ALL}\n")
         input(f"{Fore.CYAN}계속하려면 Enter를 누르세요...{Style.RESET_ALL}")
 
-    def execute_file(self, filepath):
-        """파일 실행 (개선된 버전)"""
+    def launch_process(self, filepath):
+        """파일 실행만 담당: .py는 캡처 모드·예열 워커·새 콘솔의 Python, 그 외는 기본 프로그램. 기다릴 수 있으면 Popen류 반환"""
+        if Path(filepath).suffix.lower() == '.py':
+            if self.settings.get("capture_output"):
+                return self.launch_captured(filepath)
+            if self.warm_pool is not None:
+                run = self.warm_pool.run(filepath)
+                if run is not None:
+                    return run
+            return subprocess.Popen([sys.executable, filepath],
+                                    creationflags=subprocess.CREATE_NEW_CONSOLE if os.name == 'nt' else 0)
+        if os.name == 'nt':
+            os.startfile(filepath)
+            return None
+        return subprocess.Popen(['xdg-open', filepath])
+
+    def open_task_log(self, filepath, max_bytes, backups):
+        """작업 경로별 로그. 같은 작업이 아직 실행 중이면 같은 로그 객체를 나눠 씀"""
+        path = log_path_for(self.script_dir / LOG_DIRNAME, filepath)
+        with self._logs_lock:
+            log = self._logs.get(path)
+            if log is None or not log.share():
+                log = self._logs[path] = RotatingLogFile(path, max_bytes, backups)
+            return log
+
+    def launch_captured(self, filepath):
+        """캡처 모드 실행: 새 콘솔 없이 파이프로 출력을 받아 logs/<파일명>-<해시>.log와 링 버퍼에 기록"""
+        def setting(key):
+            try:
+                return int(self.settings.get(key, DEFAULT_SETTINGS[key]))
+            except (TypeError, ValueError):
+                return DEFAULT_SETTINGS[key]
+
+        env = dict(os.environ, PYTHONUNBUFFERED="1", PYTHONIOENCODING="utf-8")
+        log = self.open_task_log(filepath, setting("log_max_kb") * 1024, setting("log_backups"))
+        log.write_line(f"--- 실행 {datetime.now():%Y-%m-%d %H:%M:%S} {filepath}")
+        try:
+            proc = subprocess.Popen([sys.executable, filepath], stdin=subprocess.DEVNULL,
+                                    stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env)
+        except Exception:
+            log.close()
+            raise
+        run = CapturedRun(proc, log, setting("tail_lines"), self._output_event)
+        self.outputs[filepath] = run
+        return run
+
+    def show_task_output(self, idx):
+        """L번호: 캡처한 최근 출력과 로그 파일 위치 표시"""
+        task = self.tasks[idx]
+        output = self.outputs.get(task.get('path', ''))
+        print(f"\n{Fore.LIGHTCYAN_EX}{'═' * 60}{Style.RESET_ALL}")
+        print(f"\n{Fore.LIGHTYELLOW_EX}{ICONS['log']} 【{idx + 1}】 {task.get('name', '')} 출력{Style.RESET_ALL}")
+        if output is None:
+            hint = "" if self.settings.get("capture_output") else " (settings.json의 capture_output을 켜세요)"
+            print(f"{Fore.LIGHTBLACK_EX}  ▸ 이번 실행 중 캡처한 출력이 없습니다{hint}{Style.RESET_ALL}")
+        else:
+            state = "실행 중" if output.running else f"종료 코드 {output.exit_code}"
+            print(f"{Fore.LIGHTBLACK_EX}  ▸ {state} · 로그: {output.log.path}{Style.RESET_ALL}\n")
+            for line in list(output.tail):
+                color = Fore.LIGHTRED_EX if line.startswith("[err] ") else Fore.WHITE
+                print(f"{color}  {line}{Style.RESET_ALL}")
+        print(f"\n{Fore.LIGHTCYAN_EX}{'═' * 60}{Style.RESET_ALL}\n")
+        input(f"{Fore.CYAN}계속하려면 Enter를 누르세요...{Style.RESET_ALL}")
+
+    def start_warm_pool(self):
+        """settings.json의 warm_workers가 1 이상이면 예열 워커 풀 시작"""
+        try:
+            size = int(self.settings.get("warm_workers") or 0)
+        except (TypeError, ValueError):
+            size = 0
+        if size <= 0:
+            return
+        imports = self.settings.get("warm_imports") or []
+        try:
+            self.warm_pool = WarmWorkerPool(Path(__file__).resolve(), size, [str(m) for m in imports])
+        except OSError:
+            self.warm_pool = None
+
+    def get_max_parallel(self):
+        """settings.json의 동시 실행 최대 개수"""
+        try:
+            return max(1, int(self.settings.get("max_parallel", DEFAULT_SETTINGS["max_parallel"])))
+        except (TypeError, ValueError):
+            return DEFAULT_SETTINGS["max_parallel"]
+
+    def run_task_and_wait(self, number, task):
+        """작업 하나를 실행하고 끝날 때까지 기다려 결과 반환 (병렬 실행 스레드에서 호출)"""
+        name = task.get('name', '제목 없음')
+        path = task.get('path', '')
+        if not os.path.exists(path):
+            return TaskRunResult(number, name, None, None, None, "파일 없음")
+        started_at = time.time()
+        t0 = time.perf_counter()
+        try:
+            proc = self.launch_process(path)
+        except Exception as e:
+            return TaskRunResult(number, name, None, None, None, str(e))
+        spawn_ms = (time.perf_counter() - t0) * 1000
+        # 기본 프로그램으로 연 파일(os.startfile)은 기다릴 프로세스가 없음
+        exit_code = proc.wait() if proc is not None else None
+        wall_s = time.perf_counter() - t0
+        self.history.record(name, path, started_at, spawn_ms,
+                            wall_s if proc is not None else None, exit_code)
+        return TaskRunResult(number, name, spawn_ms, wall_s, exit_code, None)
+
+    def start_task(self, filepath, name=None):
+        """작업 실행 + 실행 기록 추적 (execute_file과 스케줄러가 함께 쓰는 경로). Popen류 또는 None 반환"""
+        started_at = time.time()
+        t0 = time.perf_counter()
+        proc = self.launch_process(filepath)
+        spawn_ms = (time.perf_counter() - t0) * 1000
+        self.track_process(name or Path(filepath).stem, filepath, started_at, t0, spawn_ms, proc)
+        return proc
+
+    def track_process(self, name, path, started_at, t0, spawn_ms, proc):
+        """단일 실행: 별도 스레드에서 프로세스 종료를 기다렸다가 실행 기록 저장"""
+        if proc is None:
+            self.history.record(name, path, started_at, spawn_ms, None, None)
+            return
+
+        def wait_and_record():
+            exit_code = proc.wait()
+            self.history.record(name, path, started_at, spawn_ms, time.perf_counter() - t0, exit_code)
+
+        threading.Thread(target=wait_and_record, daemon=True, name="run-tracker").start()
+
+    def run_tasks_parallel(self, indices):
+        """선택한 여러 작업을 동시 실행 수 제한 안에서 병렬 실행하고, 모두 끝나면 결과 표 출력"""
+        max_parallel = self.get_max_parallel()
+        print(f"\n{Fore.LIGHTCYAN_EX}{'═' * 60}{Style.RESET_ALL}")
+        print(f"\n{Fore.LIGHTYELLOW_EX}{ICONS['lightning']} {len(indices)}개 작업 병렬 실행 (동시 최대 {max_parallel}개){Style.RESET_ALL}\n")
+
+        order = {idx + 1: pos for pos, idx in enumerate(indices)}
+        results = []
+        with ThreadPoolExecutor(max_workers=min(max_parallel, len(indices)),
+                                thread_name_prefix="task-run") as pool:
+            futures = [pool.submit(self.run_task_and_wait, idx + 1, self.tasks[idx]) for idx in indices]
+            for future in as_completed(futures):
+                result = future.result()
+                results.append(result)
+                if result.error:
+                    print(f"{Fore.RED}  {ICONS['error']} 【{result.number}】 {result.name} - {result.error}{Style.RESET_ALL}")
+                elif result.exit_code not in (None, 0):
+                    print(f"{Fore.RED}  {ICONS['warning']} 【{result.number}】 {result.name} 종료 코드 {result.exit_code}{Style.RESET_ALL}")
+                else:
+                    print(f"{Fore.GREEN}  {ICONS['success']} 【{result.number}】 {result.name} 완료{Style.RESET_ALL}")
+
+        results.sort(key=lambda r: order[r.number])
+        self.print_run_summary(results)
+        print(f"{Fore.LIGHTCYAN_EX}{'═' * 60}{Style.RESET_ALL}\n")
+        input(f"{Fore.CYAN}계속하려면 Enter를 누르세요...{Style.RESET_ALL}")
+
+    def run_pipeline(self, targets):
+        """선택한 작업과 선행작업 전체를 의존 순서대로 실행. 서로 독립인 작업은 병렬,
+        실패한 작업의 하위 작업만 건너뜀"""
+        try:
+            deps = resolve_dependencies(self.tasks)
+            order = pipeline_order(targets, deps)
+        except ValueError as e:
+            print(f"\n{Fore.RED}{ICONS['warning']} {e}{Style.RESET_ALL}")
+            input(f"\n{Fore.CYAN}계속하려면 Enter를 누르세요...{Style.RESET_ALL}")
+            return
+
+        max_parallel = self.get_max_parallel()
+        print(f"\n{Fore.LIGHTCYAN_EX}{'═' * 60}{Style.RESET_ALL}")
+        print(f"\n{Fore.LIGHTYELLOW_EX}{ICONS['chain']} 파이프라인 {len(order)}개 작업 실행 (동시 최대 {max_parallel}개){Style.RESET_ALL}")
+        print(f"{Fore.LIGHTBLACK_EX}  순서: {' → '.join(str(i + 1) for i in order)}{Style.RESET_ALL}\n")
+
+        waiting = {i: len(deps[i]) for i in order}
+        children = {i: [c for c in order if i in deps[c]] for i in order}
+        results = {}
+
+        def skip_downstream(failed):
+            # 실패한 작업에 (직간접으로) 의존하는 작업은 실행하지 않음
+            stack = list(children[failed])
+            while stack:
+                i = stack.pop()
+                if i in results:
+                    continue
+                task = self.tasks[i]
+                results[i] = TaskRunResult(i + 1, task.get('name', '제목 없음'), None, None, None,
+                                           f"건너뜀 (선행 {failed + 1} 실패)")
+                print(f"{Fore.LIGHTBLACK_EX}  ⏭ 【{i + 1}】 {task.get('name', '')} 건너뜀{Style.RESET_ALL}")
+                stack.extend(children[i])
+
+        with ThreadPoolExecutor(max_workers=min(max_parallel, len(order)),
+                                thread_name_prefix="pipeline") as pool:
+            running = {}
+
+            def submit_ready():
+                for i in order:
+                    if i not in results and i not in running.values() and waiting[i] == 0:
+                        running[pool.submit(self.run_task_and_wait, i + 1, self.tasks[i])] = i
+
+            submit_ready()
+            while running:
+                done, _ = wait_futures(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    i = running.pop(future)
+                    result = future.result()
+                    results[i] = result
+                    if result.error or result.exit_code not in (None, 0):
+                        reason = result.error or f"종료 코드 {result.exit_code}"
+                        print(f"{Fore.RED}  {ICONS['error']} 【{i + 1}】 {result.name} - {reason}{Style.RESET_ALL}")
+                        skip_downstream(i)
+                        continue
+                    print(f"{Fore.GREEN}  {ICONS['success']} 【{i + 1}】 {result.name} 완료{Style.RESET_ALL}")
+                    for child in children[i]:
+                        waiting[child] -= 1
+                submit_ready()
+
+        self.print_run_summary([results[i] for i in order])
+        print(f"{Fore.LIGHTCYAN_EX}{'═' * 60}{Style.RESET_ALL}\n")
+        input(f"{Fore.CYAN}계속하려면 Enter를 누르세요...{Style.RESET_ALL}")
+
+    def print_run_summary(self, results):
+        """병렬 실행 결과 표: 실행 지연, 전체 소요 시간, 종료 코드"""
+        print(f"\n{Fore.LIGHTYELLOW_EX}{ICONS['target']} 실행 결과{Style.RESET_ALL}")
+        def rjust(text, width):
+            return " " * max(0, width - display_width(text)) + text
+
+        print(f"{Fore.LIGHTBLACK_EX}  {fit_display('번호', 6)}{fit_display('작업', 26)}"
+              f"{rjust('실행 지연', 12)}{rjust('소요 시간', 12)}   종료 코드{Style.RESET_ALL}")
+        for r in results:
+            spawn = "-" if r.spawn_ms is None else f"{r.spawn_ms:.0f} ms"
+            wall = "-" if r.wall_s is None else f"{r.wall_s:.1f} s"
+            if r.error:
+                code, color = r.error, Fore.RED
+            elif r.exit_code is None:
+                code, color = "-", Fore.WHITE
+            else:
+                code, color = str(r.exit_code), (Fore.GREEN if r.exit_code == 0 else Fore.RED)
+            print(f"  {color}{fit_display(str(r.number), 6)}{fit_display(r.name, 26)}"
+                  f"{rjust(spawn, 12)}{rjust(wall, 12)}   {code}{Style.RESET_ALL}")
+
+    def execute_file(self, filepath, name=None):
+        """파일 실행 (개선된 버전). 실행 기록은 종료 시 백그라운드에서 저장"""
         print(f"\n{Fore.LIGHTCYAN_EX}{'═' * 60}{Style.RESET_ALL}")
 
         if not os.path.exists(filepath):
@@ -449,24 +2245,16 @@ class TaskLauncher:
             print(f"{Fore.LIGHTBLUE_EX}  파일: {file_name}{Style.RESET_ALL}")
             print(f"{Fore.LIGHTBLACK_EX}  경로: {filepath}{Style.RESET_ALL}\n")
 
-            # 로딩 애니메이션
-            self.print_loading_animation("실행 준비", 0.5)
-
             if file_ext == '.py':
                 # Python 파일 실행
                 print(f"{Fore.GREEN}{ICONS['python']} Python 스크립트를 실행합니다...{Style.RESET_ALL}")
-                subprocess.Popen([sys.executable, filepath],
-                               creationflags=subprocess.CREATE_NEW_CONSOLE if os.name == 'nt' else 0)
             else:
                 # 기타 파일 실행 (엑셀, 폴더 등)
                 icon = self.get_file_icon(filepath)
                 print(f"{Fore.GREEN}{icon} 파일을 실행합니다...{Style.RESET_ALL}")
-                if os.name == 'nt':
-                    os.startfile(filepath)
-                else:
-                    subprocess.Popen(['xdg-open', filepath])
+            with Spinner("실행 준비"):
+                self.start_task(filepath, name)
 
-            time.sleep(0.3)
             print(f"\n{Fore.LIGHTGREEN_EX}{ICONS['success']} 실행 완료!{Style.RESET_ALL}\n")
             print(f"{Fore.LIGHTCYAN_EX}{'═' * 60}{Style.RESET_ALL}\n")
             input(f"{Fore.CYAN}계속하려면 Enter를 누르세요...{Style.RESET_ALL}")
@@ -477,8 +2265,9 @@ class TaskLauncher:
             print(f"{Fore.LIGHTCYAN_EX}{'═' * 60}{Style.RESET_ALL}\n")
             input(f"{Fore.CYAN}계속하려면 Enter를 누르세요...{Style.RESET_ALL}")
 
-    def show_startup_animation(self):
-        """시작 애니메이션"""
+    def show_startup_animation(self, init_work=None):
+        """시작 애니메이션: 로고 출력 후, 실제 초기화(init_work)가 도는 동안만 스피너 표시.
+        init_work가 돌려준 메시지 줄은 스피너를 지운 뒤 출력"""
         self.clear_screen()
         print("\n" * 5)
 
@@ -495,38 +2284,130 @@ class TaskLauncher:
 
         for line in logo:
             print(f"{Fore.CYAN}{Style.BRIGHT}{line}{Style.RESET_ALL}")
-            time.sleep(0.1)
 
         print("\n")
-        self.print_loading_animation("시스템 초기화", 1.2)
+        messages = []
+        with Spinner("시스템 초기화"):
+            if init_work is not None:
+                messages = init_work() or []
+        for line in messages:
+            print(line)
         print(f"{Fore.GREEN}{ICONS['success']} 준비 완료!\n{Style.RESET_ALL}")
-        time.sleep(0.5)
+
+    def start_resident_server(self):
+        """settings.json의 resident가 켜져 있으면 다음 실행의 '창 띄우기' 요청을 받기 시작"""
+        if not self.settings.get("resident"):
+            return
+        try:
+            self.resident = ResidentServer()
+            self.resident.start()
+        except Exception as e:
+            self.resident = None
+            print(f"{Fore.LIGHTBLACK_EX}  ▸ 상주 모드를 시작하지 못했습니다: {e}{Style.RESET_ALL}")
+
+    def wait_hidden(self):
+        """상주 모드의 Q: 창을 숨기고 다음 실행이 창을 요청할 때까지 대기 (감시·스케줄러는 계속 동작)"""
+        self.clear_screen()
+        print(f"{Fore.LIGHTBLACK_EX}{ICONS['hourglass']} 백그라운드에서 대기 중입니다. "
+              f"run.bat을 다시 실행하면 이 창이 열립니다 (완전히 끄기: Ctrl+C){Style.RESET_ALL}")
+        self.resident.show_requested.clear()
+        hide_own_console_window()
+        while not self.resident.show_requested.wait(1.0):
+            pass
+        self.resident.show_requested.clear()
+        show_own_console_window()
+        self.renderer.invalidate()
+
+    def initialize(self):
+        """시작 시 실제 작업: 템플릿 확인 후 작업 목록 로딩. 출력할 메시지 줄 목록 반환"""
+        with self.profile_phase("ensure_excel_template"):
+            messages = self.ensure_excel_template()
+        with self.profile_phase("load_tasks_from_excel"):
+            messages += self.load_tasks_from_excel()
+        return messages
 
     def run(self):
         """메인 루프: 창 열림 → 메뉴 표시. 수정 시 [E]로 엑셀 열어 편집 후 다시 읽기"""
-        if os.name == 'nt':
-            os.system('title 🚀 JP 통합업무 대시보드')
-            setup_console_appearance()
+        with self.profile_phase("콘솔 설정"):
+            if os.name == 'nt':
+                set_console_title('🚀 JP 통합업무 대시보드')
+                setup_console_appearance()
 
-        # 시작 애니메이션
-        self.show_startup_animation()
+        # 시작 애니메이션 (초기화 작업과 동시에 진행)
+        self.show_startup_animation(self.initialize)
 
-        self.ensure_excel_template()
-        self.load_tasks_from_excel()
+        # 엑셀 변경 감시 (저장하면 메뉴에 자동 반영)
+        self.watcher = WorkbookWatcher(self)
+        self.watcher.start()
 
-        while True:
-            self.display_main_menu()
+        # .py 작업용 예열 워커 (settings.json의 warm_workers로 켬)
+        self.start_warm_pool()
 
-            choice = input(f"{Fore.LIGHTYELLOW_EX}{Style.BRIGHT}▸ 선택: {Style.RESET_ALL}").strip().upper()
+        # --scheduler: 스케줄러 모드로 시작 (메뉴에서 [S]로 켜고 끌 수 있음)
+        if "--scheduler" in sys.argv:
+            self.toggle_scheduler()
 
-            if choice == 'Q':
+        # 상주 모드 (settings.json의 resident로 켬)
+        self.start_resident_server()
+
+        first_render = True
+        while True:
+            if first_render and self.profiler is not None:
+                with self.profile_phase("첫 display_main_menu"):
+                    self.display_main_menu()
+                self.profiler.print_report()
+                self.renderer.invalidate()
+            else:
+                pending = self.watcher.take_pending()
+                if pending is not None:
+                    self.apply_reloaded_tasks(*pending)
+                self.display_main_menu()
+            first_render = False
+
+            raw_choice = self.line_reader.read_line(
+                f"{Fore.LIGHTYELLOW_EX}{Style.BRIGHT}▸ 선택: {Style.RESET_ALL}",
+                on_idle=self.poll_background,
+                on_change=self.on_input_change,
+            ).strip()
+            choice = raw_choice.upper()
+            self.reload_notice = ""
+
+            if not choice:
+                # Enter만 누르면 화면(파일 상태) 새로고침
+                continue
+
+            # 검색 필터·페이지 이동은 메뉴만 다시 그림
+            if raw_choice.startswith("/"):
+                self.set_filter(raw_choice[1:])
+                continue
+            if choice in (">", "<"):
+                self.page += 1 if choice == ">" else -1
+                continue
+            if choice == 'S':
+                self.toggle_scheduler()
+                continue
+
+            # 메뉴 아래에 다른 내용이 출력되므로 다음 화면은 전체 다시 그림
+            self.renderer.invalidate()
+
+            if choice == 'Q' and self.resident is not None:
+                # 상주 모드: 창만 숨김 (Q!로 완전히 종료)
+                self.wait_hidden()
+                continue
+
+            if choice in ('Q', 'Q!'):
                 # 종료 애니메이션
                 print(f"\n{Fore.LIGHTCYAN_EX}{'═' * 60}{Style.RESET_ALL}")
                 print(f"\n{Fore.LIGHTMAGENTA_EX}{ICONS['gem']} 프로그램을 종료합니다...{Style.RESET_ALL}\n")
-                self.print_loading_animation("종료 중", 0.8)
                 print(f"\n{Fore.MAGENTA}{ICONS['star']} 이용해 주셔서 감사합니다!{Style.RESET_ALL}\n")
                 print(f"{Fore.LIGHTCYAN_EX}{'═' * 60}{Style.RESET_ALL}\n")
-                time.sleep(0.5)
+                self.watcher.stop()
+                if self.scheduler is not None:
+                    self.scheduler.stop()
+                if self.warm_pool is not None:
+                    self.warm_pool.close()
+                if self.resident is not None:
+                    self.resident.stop()
                 break
 
             elif choice == 'E':
@@ -536,14 +2417,33 @@ class TaskLauncher:
                 idx = int(choice) - 1
                 if 0 <= idx < len(self.tasks):
                     task = self.tasks[idx]
-                    self.execute_file(task.get('path', ''))
+                    self.execute_file(task.get('path', ''), task.get('name'))
+                else:
+                    print(f"\n{Fore.RED}{ICONS['error']} 올바른 번호를 입력하세요 (1-{len(self.tasks)}){Style.RESET_ALL}")
+                    input(f"\n{Fore.CYAN}계속하려면 Enter를 누르세요...{Style.RESET_ALL}")
+
+            elif choice.startswith('L') and choice[1:].isdigit():
+                idx = int(choice[1:]) - 1
+                if 0 <= idx < len(self.tasks):
+                    self.show_task_output(idx)
                 else:
                     print(f"\n{Fore.RED}{ICONS['error']} 올바른 번호를 입력하세요 (1-{len(self.tasks)}){Style.RESET_ALL}")
                     input(f"\n{Fore.CYAN}계속하려면 Enter를 누르세요...{Style.RESET_ALL}")
 
             else:
-                print(f"\n{Fore.RED}{ICONS['warning']} 올바른 옵션을 선택하세요 (번호/E/Q){Style.RESET_ALL}")
-                input(f"\n{Fore.CYAN}계속하려면 Enter를 누르세요...{Style.RESET_ALL}")
+                # 여러 작업 선택 (1,3,5-8 / @그룹), P를 붙이면 선행작업까지 파이프라인 실행
+                pipeline = choice.startswith('P')
+                try:
+                    indices = parse_task_selection(choice[1:] if pipeline else choice, self.tasks)
+                except ValueError as e:
+                    print(f"\n{Fore.RED}{ICONS['warning']} {e}{Style.RESET_ALL}")
+                    print(f"{Fore.LIGHTBLACK_EX}  ▸ 번호 / 1,3,5-8 / @그룹 / P번호 / L번호 / E / S / Q 중에서 입력하세요{Style.RESET_ALL}")
+                    input(f"\n{Fore.CYAN}계속하려면 Enter를 누르세요...{Style.RESET_ALL}")
+                    continue
+                if pipeline:
+                    self.run_pipeline(indices)
+                else:
+                    self.run_tasks_parallel(indices)
 
 
 def launch_in_new_console():
@@ -557,9 +2457,9 @@ def launch_in_new_console():
         return False  # 이미 새 창에서 실행 중
     script_path = Path(__file__).resolve()
     try:
-        # CREATE_NEW_CONSOLE: IDE 터미널이 아닌 새 콘솔 창에서만 실행
+        # CREATE_NEW_CONSOLE: IDE 터미널이 아닌 새 콘솔 창에서만 실행 (--profile-startup 등 옵션 전달)
         subprocess.Popen(
-            [sys.executable, "-u", str(script_path), "--in-console"],
+            [sys.executable, "-u", str(script_path), "--in-console", *sys.argv[1:]],
             cwd=str(script_path.parent),
             creationflags=subprocess.CREATE_NEW_CONSOLE,
         )
@@ -569,6 +2469,11 @@ def launch_in_new_console():
 
 
 if __name__ == "__main__":
+    if "--warm-worker" in sys.argv:
+        sys.exit(run_warm_worker())
+    # 상주 모드: 이미 떠 있는 런처가 있으면 그 창을 띄우고 바로 종료
+    if load_settings(Path(__file__).resolve().parent).get("resident") and signal_resident():
+        sys.exit(0)
     if launch_in_new_console():
         sys.exit(0)
     launcher = TaskLauncher()
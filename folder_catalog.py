@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+폴더 카탈로그: 폴더 목록 스크립트(25-01-05, 25-12-04)가 조사한 폴더 경로를
+로컬 SQLite DB에 모아 두고, 경로 구성요소(폴더 이름들)의 FTS5 trigram 색인으로
+"X가 들어 있는 폴더가 어디였지?"를 디스크를 다시 읽지 않고 바로 찾음.
+검색어는 폴더 이름의 어느 부분과도 일치함 (띄어쓰기 없는 '애니노블'도 '노블'로 찾음).
+
+    python folder_catalog.py 애니 노블          # 모든 조사 폴더에서 검색 (…\애니노블\… 도 찾음)
+    python folder_catalog.py 애니 --root M:\\    # 특정 조사 폴더에서만
+    python folder_catalog.py --roots            # 조사한 폴더 목록
+"""
+
+import argparse
+import os
+import re
+import sqlite3
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+# 기본 DB 위치 (이 파일과 같은 폴더)
+DEFAULT_DB = os.path.join(os.path.dirname(os.path.abspath(__file__)), "folder_catalog.sqlite3")
+
+# 트랜잭션 하나에 넣는 행 수 (너무 작으면 커밋이 잦아 느리고, 크면 실패 시 되돌리는 양이 큼)
+BATCH_SIZE = 10_000
+
+# 경로를 폴더 이름들로 나누는 구분자
+COMPONENT_SPLIT_RE = re.compile(r"[\\/]+")
+
+# trigram 색인은 3글자 이상 검색어만 찾을 수 있음. 더 짧은 검색어는 경로 LIKE 검색으로 대신함
+TRIGRAM_MIN = 3
+FTS_SCHEMA = ("CREATE VIRTUAL TABLE folder_fts USING fts5("
+              "components, content='', tokenize='trigram')")
+
+
+def path_components(path):
+    """'M:\\애니노블\\작품 A' → '애니노블 작품 A' (드라이브·구분자를 빼고 폴더 이름만 공백으로 이음)"""
+    _, tail = os.path.splitdrive(path)
+    return " ".join(p for p in COMPONENT_SPLIT_RE.split(tail) if p)
+
+
+def split_terms(text):
+    """
+    검색어를 (FTS5 질의, LIKE 패턴 목록)으로 나눔. 모든 단어가 들어 있어야 일치.
+    3글자 이상은 따옴표로 감싼 trigram 부분 일치, 그보다 짧으면 경로 LIKE '%단어%'.
+    (예: '드래곤 볼' → ('"드래곤"', ['%볼%']))
+    """
+    terms = [t for t in re.split(r"[\s\\/]+", text) if t]
+    query = " ".join('"' + t.replace('"', '""') + '"' for t in terms if len(t) >= TRIGRAM_MIN)
+    likes = ["%" + re.sub(r"([\\%_])", r"\\\1", t) + "%" for t in terms if len(t) < TRIGRAM_MIN]
+    return query, likes
+
+
+class FolderCatalog:
+    """
+    조사 폴더(root)별 폴더 경로 목록 + FTS5 색인.
+    같은 조사 폴더를 다시 기록하면 새 목록을 다 모은 뒤에 이전 목록과 한 번에 바꿈.
+    모으는 동안의 행은 root_id를 음수(-root_id)로 두어 검색에서 빠짐.
+    """
+
+    def __init__(self, db_path=None):
+        self.db_path = db_path or DEFAULT_DB
+        self.conn = sqlite3.connect(str(self.db_path), timeout=5)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        try:
+            with self.conn:
+                self.conn.execute("""
+                    CREATE TABLE IF NOT EXISTS roots (
+                        id INTEGER PRIMARY KEY,
+                        path TEXT NOT NULL UNIQUE,
+                        scanned_at REAL,
+                        folder_count INTEGER
+                    )""")
+                self.conn.execute("""
+                    CREATE TABLE IF NOT EXISTS folders (
+                        id INTEGER PRIMARY KEY,
+                        root_id INTEGER NOT NULL,
+                        path TEXT NOT NULL
+                    )""")
+                self.conn.execute("CREATE INDEX IF NOT EXISTS idx_folders_root ON folders (root_id)")
+                # rowid = folders.id, 색인만 하고 내용은 folders에 있음
+                row = self.conn.execute(
+                    "SELECT sql FROM sqlite_master WHERE name = 'folder_fts'").fetchone()
+                if row is None or row[0] != FTS_SCHEMA:
+                    self._rebuild_index(row is not None)
+        except sqlite3.OperationalError as e:
+            self.conn.close()
+            raise RuntimeError(f"이 파이썬의 SQLite는 FTS5 trigram을 지원하지 않습니다 (3.34 이상 필요): {e}") from e
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _rebuild_index(self, drop):
+        """색인이 없거나 예전 형식(unicode61)이면 folders에서 다시 만듦"""
+        if drop:
+            self.conn.execute("DROP TABLE folder_fts")
+        self.conn.execute(FTS_SCHEMA)
+        cur = self.conn.execute("SELECT id, path FROM folders")
+        while True:
+            rows = cur.fetchmany(BATCH_SIZE)
+            if not rows:
+                break
+            self.conn.executemany("INSERT INTO folder_fts (rowid, components) VALUES (?, ?)",
+                                  [(i, path_components(p)) for i, p in rows])
+
+    def _clear_root(self, root_id):
+        ids = self.conn.execute("SELECT id FROM folders WHERE root_id = ?", (root_id,)).fetchall()
+        # contentless 색인은 지울 때 원래 내용을 알아야 하므로 경로에서 다시 만듦
+        for start in range(0, len(ids), BATCH_SIZE):
+            chunk = [i for (i,) in ids[start:start + BATCH_SIZE]]
+            marks = ",".join("?" * len(chunk))
+            rows = self.conn.execute(f"SELECT id, path FROM folders WHERE id IN ({marks})", chunk).fetchall()
+            self.conn.executemany(
+                "INSERT INTO folder_fts (folder_fts, rowid, components) VALUES ('delete', ?, ?)",
+                [(i, path_components(p)) for i, p in rows])
+        self.conn.execute("DELETE FROM folders WHERE root_id = ?", (root_id,))
+
+    @contextmanager
+    def scan(self, root, batch_size=BATCH_SIZE):
+        """
+        조사 폴더 root의 폴더 목록을 새로 기록. with 블록 안에서 add(경로)를 부르면
+        batch_size개씩 모아 트랜잭션 하나로 넣음(행마다 커밋하지 않음).
+        블록이 끝나면 이전 목록을 새 목록으로 한 번에 바꾸고, 예외로 끝나면 모은 행만 지움
+        (어느 쪽이든 이전 목록은 중간에 비지 않음).
+
+            with catalog.scan(folder_path) as add:
+                for path in iter_subfolders(folder_path):
+                    add(path)
+        """
+        root = os.path.abspath(root)
+        with self.conn:
+            self.conn.execute("INSERT OR IGNORE INTO roots (path, folder_count) VALUES (?, 0)", (root,))
+            root_id = self.conn.execute("SELECT id FROM roots WHERE path = ?", (root,)).fetchone()[0]
+            # 지난번에 강제 종료되어 남은 임시 행 정리
+            self._clear_root(-root_id)
+
+        batch = []
+        count = 0
+
+        def flush():
+            with self.conn:
+                # id는 SQLite가 정함 (다른 프로세스가 동시에 넣어도 겹치지 않음)
+                cur = self.conn.cursor()
+                fts_rows = []
+                for p in batch:
+                    cur.execute("INSERT INTO folders (root_id, path) VALUES (?, ?)", (-root_id, p))
+                    fts_rows.append((cur.lastrowid, path_components(p)))
+                self.conn.executemany("INSERT INTO folder_fts (rowid, components) VALUES (?, ?)", fts_rows)
+            batch.clear()
+
+        def add(path):
+            nonlocal count
+            batch.append(os.path.abspath(path))
+            count += 1
+            if len(batch) >= batch_size:
+                flush()
+
+        try:
+            yield add
+            if batch:
+                flush()
+        except BaseException:
+            with self.conn:
+                self._clear_root(-root_id)
+            raise
+        with self.conn:
+            self._clear_root(root_id)
+            self.conn.execute("UPDATE folders SET root_id = ? WHERE root_id = ?", (root_id, -root_id))
+            self.conn.execute("UPDATE roots SET scanned_at = ?, folder_count = ? WHERE id = ?",
+                              (time.time(), count, root_id))
+
+    def search(self, text, root=None, limit=50):
+        """
+        검색어가 경로에 모두 들어 있는 폴더 경로 목록 (대소문자 무시).
+        3글자 이상 검색어가 있으면 색인으로 찾아 관련도순, 짧은 검색어만 있으면 전체 경로를 훑어 짧은 경로순.
+        """
+        query, likes = split_terms(text)
+        if query:
+            sql = ("SELECT f.path FROM folder_fts JOIN folders f ON f.id = folder_fts.rowid"
+                   " WHERE folder_fts MATCH ? AND f.root_id > 0")
+            params = [query]
+        elif likes:
+            sql = "SELECT f.path FROM folders f WHERE f.root_id > 0"
+            params = []
+        else:
+            return []
+        for pattern in likes:
+            sql += " AND f.path LIKE ? ESCAPE '\\'"
+            params.append(pattern)
+        if root is not None:
+            sql += " AND f.root_id = (SELECT id FROM roots WHERE path = ?)"
+            params.append(os.path.abspath(root))
+        sql += " ORDER BY rank LIMIT ?" if query else " ORDER BY length(f.path), f.path LIMIT ?"
+        params.append(limit)
+        return [p for (p,) in self.conn.execute(sql, params)]
+
+    def roots(self):
+        """[(조사 폴더, 조사 시각 또는 None, 폴더 수)]"""
+        return self.conn.execute("SELECT path, scanned_at, folder_count FROM roots ORDER BY path").fetchall()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="조사해 둔 폴더 목록에서 폴더 이름 검색")
+    parser.add_argument("query", nargs="*", help="검색어 (여러 단어면 모두 들어 있는 폴더)")
+    parser.add_argument("--db", default=DEFAULT_DB, help=f"카탈로그 DB 경로 (기본: {DEFAULT_DB})")
+    parser.add_argument("--root", help="이 조사 폴더의 결과에서만 검색")
+    parser.add_argument("--limit", type=int, default=50, help="최대 결과 수 (기본 50)")
+    parser.add_argument("--roots", action="store_true", help="조사한 폴더 목록 보기")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        print(f"카탈로그가 없습니다: {args.db} (폴더 목록 스크립트를 --catalog 옵션으로 먼저 실행하세요)")
+        return
+
+    with FolderCatalog(args.db) as catalog:
+        if args.roots or not args.query:
+            for path, scanned_at, count in catalog.roots():
+                when = datetime.fromtimestamp(scanned_at).strftime("%Y-%m-%d %H:%M") if scanned_at else "미완료"
+                print(f" - {path}  ({count:,}개, {when})")
+            return
+        t0 = time.perf_counter()
+        results = catalog.search(" ".join(args.query), args.root, args.limit)
+        elapsed_ms = (time.perf_counter() - t0) * 1000
+        for path in results:
+            print(" -", path)
+        print(f"\n총 {len(results)}개 ({elapsed_ms:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()